@@ -15,6 +15,13 @@ from typing import Dict, Any
 import tempfile
 import threading
 
+try:
+    import orjson
+    # JSON providers need Flask 2.2+; older Flask keeps its stdlib encoder
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:
+    orjson = None
+
 # Import calculator
 from main import DataCenterCoolingCalculator
 
@@ -33,10 +40,27 @@ logger = logging.getLogger(__name__)
 # Create global calculator instance
 calculator = DataCenterCoolingCalculator()
 
+if orjson is not None:
+    class OrjsonProvider(DefaultJSONProvider):
+        """JSON provider that encodes and decodes request/response bodies with orjson."""
+        
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            return orjson.dumps(
+                obj, default=self.default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ).decode()
+        
+        def loads(self, s: Any, **kwargs: Any) -> Any:
+            return orjson.loads(s)
+
+
 def create_api_app():
     """Create and configure the Flask application."""
     app = Flask(__name__)
     
+    # Use orjson for jsonify and request.get_json when it is installed (Flask 2.2+)
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+    
     # Configure application
     app.config.from_mapping(
         SECRET_KEY=os.environ.get('SECRET_KEY', 'dev'),
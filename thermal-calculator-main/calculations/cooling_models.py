@@ -15,7 +15,6 @@ class BaseCoolingModel:
     def __init__(self, product_data: Dict[str, Any], fluid_properties: Dict[str, Any]):
         self.product = product_data
         self.fluid_properties = fluid_properties
-        self.results = {}
     
     def calculate(self, cooling_kw: float, room_temp: float, desired_temp: float, 
                  water_temp: float, **kwargs) -> Dict[str, Any]:
@@ -304,7 +303,7 @@ class ActiveCoolingModel(BaseCoolingModel):
             )
         
         # Combine results
-        self.results = {
+        results = {
             "cooling_capacity": cooling_kw,
             "water_side": water_side,
             "air_side": air_side,
@@ -313,9 +312,9 @@ class ActiveCoolingModel(BaseCoolingModel):
         }
         
         if commercial:
-            self.results["commercial"] = commercial
-            
-        return self.results
+            results["commercial"] = commercial
+        
+        return results
     
     def _calculate_water_side(self, cooling_kw: float, water_temp: float, 
                              return_water_temp: Optional[float] = None,
@@ -669,7 +668,7 @@ class PassiveCoolingModel(BaseCoolingModel):
             )
         
         # Combine results
-        self.results = {
+        results = {
             "cooling_capacity": cooling_kw,
             "water_side": water_side,
             "air_side": air_side,
@@ -678,9 +677,9 @@ class PassiveCoolingModel(BaseCoolingModel):
         }
         
         if commercial:
-            self.results["commercial"] = commercial
-            
-        return self.results
+            results["commercial"] = commercial
+        
+        return results
     
     def _calculate_water_side(self, cooling_kw: float, water_temp: float, 
                              return_water_temp: Optional[float] = None,
@@ -0,0 +1,304 @@
+# calculations/fluid_properties.py
+
+"""
+Tabulated fluid properties for the Data Center Cooling Calculator.
+
+This module holds the fluid property tables as NumPy structure-of-arrays
+and evaluates them at a temperature and glycol concentration:
+- Base properties interpolated over temperature
+- Concentration factors interpolated over glycol percentage
+- Scalar and array (batch) queries
+
+Properties are returned in calculator units and ordered as PROPERTY_NAMES:
+density (kg/m³), specific heat (kJ/kg·K), viscosity (Pa·s) and thermal
+conductivity (W/m·K).
+"""
+
+import bisect
+import logging
+from typing import Dict, Any, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from database.schema import SAMPLE_FLUID_PROPERTIES
+
+logger = logging.getLogger(__name__)
+
+PROPERTY_NAMES = ("density", "specific_heat", "viscosity", "thermal_conductivity")
+
+# The tables store viscosity in mPa·s; the calculator works in Pa·s
+_UNIT_SCALE = np.array([1.0, 1.0, 1e-3, 1.0])
+
+# Viscosity varies by orders of magnitude over the tables, so it is stored
+# and interpolated as log10 values (both base values and glycol factors)
+LOG_PROPERTIES = (False, False, True, False)
+_LOG_ROWS = np.array(LOG_PROPERTIES)
+
+
+class FluidTable(NamedTuple):
+    """
+    Property tables for one fluid, one row per entry in PROPERTY_NAMES.
+    
+    The inverse grid steps are non-zero when the grid is uniformly spaced,
+    which lets lookups compute the interval index directly. Rows flagged in
+    LOG_PROPERTIES hold log10 values.
+    """
+    temperatures: np.ndarray  # (n_temps,) °C
+    properties: np.ndarray  # (4, n_temps), calculator units
+    concentrations: np.ndarray  # (n_concs,) %
+    concentration_factors: np.ndarray  # (4, n_concs)
+    inv_temperature_step: float  # 1/°C, or 0.0 if non-uniform
+    inv_concentration_step: float  # 1/%, or 0.0 if non-uniform
+
+
+def _uniform_inverse_step(x_values: np.ndarray) -> float:
+    """
+    Get the inverse spacing of a uniformly spaced grid.
+    
+    Args:
+        x_values: Sorted grid
+    
+    Returns:
+        1/step if the grid is uniform, otherwise 0.0
+    """
+    if len(x_values) < 2:
+        return 0.0
+    
+    steps = np.diff(x_values)
+    if steps[0] > 0 and np.allclose(steps, steps[0]):
+        return 1.0 / float(steps[0])
+    return 0.0
+
+
+def _widen_single_point(x_values: np.ndarray, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Duplicate a single-point grid into one flat interval."""
+    if len(x_values) != 1:
+        return x_values, rows
+    return np.append(x_values, x_values[0] + 1.0), np.repeat(rows, 2, axis=1)
+
+
+def _build_table(fluid: Dict[str, Any]) -> FluidTable:
+    """
+    Convert one fluid record into contiguous float64 arrays.
+    
+    Fluids without concentration data get unit factors over 0-100 %, and
+    single-point grids are widened to two equal points, so every table has
+    at least one interval and can be evaluated the same way.
+    
+    Args:
+        fluid: Fluid record as defined by FLUID_PROPERTIES_SCHEMA
+    
+    Returns:
+        FluidTable for the fluid
+    """
+    temperatures = np.asarray(fluid["temperatures"], dtype=np.float64)
+    properties = np.stack([
+        np.asarray(fluid["properties"][name], dtype=np.float64) for name in PROPERTY_NAMES
+    ]) * _UNIT_SCALE[:, None]
+    
+    factors = fluid.get("concentration_factors")
+    if factors and fluid.get("concentrations"):
+        concentrations = np.asarray(fluid["concentrations"], dtype=np.float64)
+        concentration_factors = np.stack([
+            np.asarray(factors[name], dtype=np.float64) for name in PROPERTY_NAMES
+        ])
+    else:
+        concentrations = np.array([0.0, 100.0])
+        concentration_factors = np.ones((len(PROPERTY_NAMES), 2))
+    
+    properties[_LOG_ROWS] = np.log10(properties[_LOG_ROWS])
+    concentration_factors[_LOG_ROWS] = np.log10(concentration_factors[_LOG_ROWS])
+    
+    temperatures, properties = _widen_single_point(temperatures, properties)
+    concentrations, concentration_factors = _widen_single_point(concentrations, concentration_factors)
+    
+    return FluidTable(
+        np.ascontiguousarray(temperatures),
+        np.ascontiguousarray(properties),
+        np.ascontiguousarray(concentrations),
+        np.ascontiguousarray(concentration_factors),
+        _uniform_inverse_step(temperatures),
+        _uniform_inverse_step(concentrations)
+    )
+
+
+FLUID_TABLES = {fluid["name"]: _build_table(fluid) for fluid in SAMPLE_FLUID_PROPERTIES}
+
+# The same tables as plain float tuples for the scalar kernel, in the
+# argument order of interp_props
+SCALAR_TABLES = {
+    name: (
+        tuple(table.temperatures.tolist()),
+        table.inv_temperature_step,
+        tuple(tuple(row) for row in table.properties.tolist()),
+        tuple(table.concentrations.tolist()),
+        table.inv_concentration_step,
+        tuple(tuple(row) for row in table.concentration_factors.tolist())
+    )
+    for name, table in FLUID_TABLES.items()
+}
+
+
+def _locate(x_values: np.ndarray, inv_step: float,
+            x: Union[float, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the grid interval and fractional position of x, clamping to the grid.
+    
+    On a uniform grid the interval index is computed directly from
+    (x - x0) / step; otherwise it is found by binary search.
+    
+    Args:
+        x_values: Sorted grid with at least two points
+        inv_step: Inverse grid step, or 0.0 for a non-uniform grid
+        x: Query point(s), scalar or array
+    
+    Returns:
+        Tuple of (interval index i, fraction in [0, 1] between x_values[i]
+        and x_values[i + 1])
+    """
+    last = len(x_values) - 1
+    x = np.clip(x, x_values[0], x_values[last])
+    
+    if inv_step:
+        position = (x - x_values[0]) * inv_step
+        i = np.minimum(position.astype(np.int64), last - 1)
+        return i, position - i
+    
+    i = np.clip(np.searchsorted(x_values, x, side="right"), 1, last) - 1
+    x1 = x_values[i]
+    return i, (x - x1) / (x_values[i + 1] - x1)
+
+
+def lookup(table: FluidTable, temperature: Union[float, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Locate a temperature on a fluid's temperature grid.
+    
+    Args:
+        table: Fluid table
+        temperature: Temperature in °C, scalar or array
+    
+    Returns:
+        Tuple of (interval index, fraction within the interval)
+    """
+    return _locate(table.temperatures, table.inv_temperature_step, temperature)
+
+
+def _locate_scalar(x_values: Tuple[float, ...], inv_step: float, x: float) -> Tuple[int, float]:
+    """Scalar counterpart of _locate working on a tuple grid."""
+    last = len(x_values) - 1
+    x = min(max(x, x_values[0]), x_values[last])
+    
+    if inv_step:
+        position = (x - x_values[0]) * inv_step
+        i = min(int(position), last - 1)
+        return i, position - i
+    
+    i = min(max(bisect.bisect_right(x_values, x), 1), last) - 1
+    x1 = x_values[i]
+    return i, (x - x1) / (x_values[i + 1] - x1)
+
+
+def interp_props(temperature: float, glycol_percentage: float,
+                 temperatures: Tuple[float, ...], inv_temperature_step: float,
+                 properties: Tuple[Tuple[float, ...], ...],
+                 concentrations: Tuple[float, ...], inv_concentration_step: float,
+                 concentration_factors: Tuple[Tuple[float, ...], ...]) -> Tuple[float, float, float, float]:
+    """
+    Scalar (T, glycol) -> (density, specific heat, viscosity, conductivity) kernel.
+    
+    Works only on floats and tuples of floats, so single queries avoid NumPy
+    dispatch overhead. The table arguments are the entries of SCALAR_TABLES.
+    
+    Args:
+        temperature: Fluid temperature in °C
+        glycol_percentage: Glycol percentage (0-100)
+        temperatures: Temperature grid in °C
+        inv_temperature_step: Inverse temperature step, or 0.0 if non-uniform
+        properties: Property rows on the temperature grid
+        concentrations: Concentration grid in %
+        inv_concentration_step: Inverse concentration step, or 0.0 if non-uniform
+        concentration_factors: Factor rows on the concentration grid
+    
+    Returns:
+        Tuple of properties ordered as PROPERTY_NAMES
+    """
+    i, t = _locate_scalar(temperatures, inv_temperature_step, temperature)
+    j, c = _locate_scalar(concentrations, inv_concentration_step, glycol_percentage)
+    
+    values = []
+    for row, factors, log_scale in zip(properties, concentration_factors, LOG_PROPERTIES):
+        base = row[i] + t * (row[i + 1] - row[i])
+        factor = factors[j] + c * (factors[j + 1] - factors[j])
+        values.append(10.0 ** (base + factor) if log_scale else base * factor)
+    return tuple(values)
+
+
+def _interp_rows(x_values: np.ndarray, inv_step: float, rows: np.ndarray,
+                 x: Union[float, np.ndarray]) -> np.ndarray:
+    """
+    Linearly interpolate every row of a table at x, clamping to the table ends.
+    
+    The bracketing interval is located once and shared by all rows.
+    
+    Args:
+        x_values: Sorted grid, shape (n,)
+        inv_step: Inverse grid step, or 0.0 for a non-uniform grid
+        rows: Values on the grid, shape (m, n)
+        x: Query point(s), scalar or array
+    
+    Returns:
+        Interpolated values, shape (m,) for scalar x or (m, *x.shape) for array x
+    """
+    i, fraction = _locate(x_values, inv_step, x)
+    lower = rows[:, i]
+    return lower + fraction * (rows[:, i + 1] - lower)
+
+
+def props_at(fluid_type: str, temperature: Union[float, np.ndarray],
+             glycol_percentage: Union[float, np.ndarray] = 0.0) -> Optional[np.ndarray]:
+    """
+    Evaluate fluid properties at a temperature and glycol concentration.
+    
+    Args:
+        fluid_type: Fluid name (water, ethylene_glycol, propylene_glycol)
+        temperature: Fluid temperature in °C, scalar or array
+        glycol_percentage: Glycol percentage (0-100), scalar or array
+    
+    Returns:
+        Array of properties ordered as PROPERTY_NAMES (shape (4,) for scalar
+        inputs, (4, *shape) for broadcast array inputs), or None if the fluid
+        is unknown
+    """
+    table = FLUID_TABLES.get(fluid_type)
+    if table is None:
+        return None
+    
+    temperature, glycol_percentage = np.broadcast_arrays(temperature, glycol_percentage)
+    base = _interp_rows(table.temperatures, table.inv_temperature_step,
+                        table.properties, temperature)
+    factor = _interp_rows(table.concentrations, table.inv_concentration_step,
+                          table.concentration_factors, glycol_percentage)
+    
+    values = base * factor
+    values[_LOG_ROWS] = 10.0 ** (base[_LOG_ROWS] + factor[_LOG_ROWS])
+    return values
+
+
+def fluid_properties_at(fluid_type: str, temperature: float,
+                        glycol_percentage: float = 0.0) -> Optional[Dict[str, float]]:
+    """
+    Evaluate fluid properties as the dictionary the cooling models expect.
+    
+    Args:
+        fluid_type: Fluid name (water, ethylene_glycol, propylene_glycol)
+        temperature: Fluid temperature in °C
+        glycol_percentage: Glycol percentage (0-100)
+    
+    Returns:
+        Dictionary of fluid properties or None if the fluid is unknown
+    """
+    table = SCALAR_TABLES.get(fluid_type)
+    if table is None:
+        return None
+    
+    return dict(zip(PROPERTY_NAMES, interp_props(temperature, glycol_percentage, *table)))
@@ -5,6 +5,8 @@ Product database for ColdLogik cooling products based on provided specifications
 This module defines the product database that will be used by the cooling calculator.
 """
 
+import bisect
+from types import MappingProxyType
 from typing import Dict, Any
 
 # ColdLogik Product Database
@@ -569,29 +571,39 @@ COLDLOGIK_PRODUCTS = [
     }
 ]
 
+# Read-only product lookup by ID, built once at import
+COLDLOGIK_BY_ID = MappingProxyType({product["id"]: product for product in COLDLOGIK_PRODUCTS})
+
+def _capacity_index(products: list) -> tuple:
+    """Sort products by capacity into parallel (capacities, products) tuples."""
+    ordered = sorted(products, key=lambda p: p.get("max_cooling_capacity", 0))
+    return tuple(p.get("max_cooling_capacity", 0) for p in ordered), tuple(ordered)
+
+# Capacity-sorted products per rack type (None for all rack types), for
+# bisecting on a required cooling capacity
+CAPACITY_INDEX = {None: _capacity_index(COLDLOGIK_PRODUCTS)}
+for _rack_type in {p.get("rack_type") for p in COLDLOGIK_PRODUCTS}:
+    CAPACITY_INDEX[_rack_type] = _capacity_index(
+        [p for p in COLDLOGIK_PRODUCTS if p.get("rack_type") == _rack_type]
+    )
+del _rack_type
+
 def get_products_by_series(series: str) -> list:
     """Get products by series name (CL20, CL21, CL23)."""
     return [p for p in COLDLOGIK_PRODUCTS if p["series"] == series]
 
 def get_product_by_id(product_id: str) -> Dict[str, Any]:
     """Get a specific product by its ID."""
-    for product in COLDLOGIK_PRODUCTS:
-        if product["id"] == product_id:
-            return product
-    return None
+    return COLDLOGIK_BY_ID.get(product_id)
 
 def get_cooling_capacity_range(rack_type: str = None) -> tuple:
     """Get the min/max cooling capacity range, optionally filtered by rack type."""
-    products = COLDLOGIK_PRODUCTS
-    if rack_type:
-        products = [p for p in products if p["rack_type"] == rack_type]
+    capacities, _ = CAPACITY_INDEX.get(rack_type or None, ((), ()))
     
-    if not products:
+    if not capacities:
         return (0, 0)
     
-    min_capacity = min(p["max_cooling_capacity"] for p in products)
-    max_capacity = max(p["max_cooling_capacity"] for p in products)
-    return (min_capacity, max_capacity)
+    return (capacities[0], capacities[-1])
 
 def recommend_product(cooling_kw: float, rack_type: str = None, passive_preferred: bool = False) -> Dict[str, Any]:
     """
@@ -605,25 +617,25 @@ def recommend_product(cooling_kw: float, rack_type: str = None, passive_preferre
     Returns:
         Recommended product or None if no suitable product found
     """
-    # Filter products by rack type if specified
-    candidates = COLDLOGIK_PRODUCTS
-    if rack_type:
-        candidates = [p for p in candidates if p["rack_type"] == rack_type]
+    # Products of the rack type sorted by capacity
+    capacities, candidates = CAPACITY_INDEX.get(rack_type or None, ((), ()))
+    if not candidates:
+        return None
+    
+    # Products from here on can handle the required cooling, smallest first
+    first_suitable = bisect.bisect_left(capacities, cooling_kw)
     
     # If passive cooling is preferred, try to find a suitable CL21 first
     if passive_preferred:
-        passive_candidates = [p for p in candidates if p["series"] == "CL21" and p["max_cooling_capacity"] >= cooling_kw]
-        if passive_candidates:
-            # Return the smallest passive solution that meets requirements
-            return min(passive_candidates, key=lambda p: p["max_cooling_capacity"])
-    
-    # Find all products that can handle the required cooling
-    suitable_candidates = [p for p in candidates if p["max_cooling_capacity"] >= cooling_kw]
+        for product in candidates[first_suitable:]:
+            if product["series"] == "CL21":
+                # Return the smallest passive solution that meets requirements
+                return product
     
-    if not suitable_candidates:
+    if first_suitable == len(candidates):
         # No suitable product found - recommend the highest capacity option
-        return max(candidates, key=lambda p: p["max_cooling_capacity"])
+        return candidates[bisect.bisect_left(capacities, capacities[-1])]
     
     # Return the most appropriately sized product
     # We look for the product with capacity closest to but not less than the requirement
-    return min(suitable_candidates, key=lambda p: p["max_cooling_capacity"])
+    return candidates[first_suitable]
@@ -5,13 +5,257 @@ This module defines the database schemas for the data center cooling calculator.
 These schemas define the structure of the data used by the calculator.
 """
 
+import bisect
+import hashlib
 import json
+import mmap
 import os
-from typing import Dict, Any, List, Optional, Union
+import sys
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
 import logging
 
+try:
+    # Optional: stream large product catalogs instead of parsing them whole
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # Optional: parse database files straight from a memory map
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Content hashes of fluid records that have already passed schema validation.
+# Shared across DatabaseManager instances so repeat loads skip the validator.
+_VALIDATED_FLUIDS = set()
+
+
+def _fluid_content_hash(fluid: Dict[str, Any]) -> str:
+    """Return a stable hash of a fluid record's canonical JSON form."""
+    canonical = json.dumps(fluid, sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _load_json(filepath: str) -> Any:
+    """
+    Parse a JSON file.
+    
+    With orjson installed the file is memory-mapped and parsed in place,
+    avoiding the intermediate str copy that json.load makes.
+    
+    Args:
+        filepath: Path to the JSON file
+        
+    Returns:
+        Parsed JSON data
+    """
+    with open(filepath, 'rb') as f:
+        if orjson is None:
+            return json.load(f)
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map an empty file; let the parser report it
+            return orjson.loads(b'')
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def _freeze(obj: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(obj, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+def thaw(obj: Any) -> Any:
+    """
+    Return a mutable deep copy of a frozen structure.
+    
+    Use this before mutating or serializing (e.g. ``json.dump``) a sample
+    record or regional settings view handed out by this module.
+    """
+    if isinstance(obj, Mapping):
+        return {k: thaw(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [thaw(v) for v in obj]
+    return obj
+
+class _LinearTable(NamedTuple):
+    """Piecewise-linear table with its per-interval slopes precomputed."""
+    x_values: Tuple[float, ...]
+    y_values: Tuple[float, ...]
+    slopes: Tuple[float, ...]
+
+
+def _linear_table(x_values: Sequence[float], y_values: Sequence[float]) -> _LinearTable:
+    """
+    Build a piecewise-linear table, computing each interval's slope once.
+    
+    Args:
+        x_values: Sorted x values
+        y_values: y values matching x_values
+        
+    Returns:
+        Linear table ready for evaluation
+    """
+    slopes = tuple(
+        (y2 - y1) / (x2 - x1) if x2 != x1 else 0.0
+        for x1, x2, y1, y2 in zip(x_values, x_values[1:], y_values, y_values[1:])
+    )
+    return _LinearTable(tuple(x_values), tuple(y_values), slopes)
+
+
+def _eval_linear(table: _LinearTable, x: float) -> float:
+    """
+    Evaluate a linear table at x, clamping to the ends of the table.
+    
+    Args:
+        table: Table built by _linear_table
+        x: x value to interpolate at
+        
+    Returns:
+        Interpolated y value
+    """
+    x_values = table.x_values
+    last = len(x_values) - 1
+    if last == 0:
+        return table.y_values[0]
+    
+    # Clamp once so out-of-range queries take the same interior path
+    x = min(max(x, x_values[0]), x_values[last])
+    
+    # Locate the bracketing interval
+    i = min(bisect.bisect_right(x_values, x), last) - 1
+    
+    return table.y_values[i] + table.slopes[i] * (x - x_values[i])
+
+
+def _interpolate(x_values: Sequence[float], y_values: Sequence[float], x: float) -> float:
+    """
+    Linearly interpolate a value, clamping to the ends of the table.
+    
+    Args:
+        x_values: Sorted x values
+        y_values: y values matching x_values
+        x: x value to interpolate at
+        
+    Returns:
+        Interpolated y value
+    """
+    return _eval_linear(_linear_table(x_values, y_values), x)
+
+
+def _interp_with_factor(values: _LinearTable, factors: Optional[_LinearTable],
+                        temperature: float, concentration: Optional[float]) -> float:
+    """
+    Interpolate a property in temperature and apply its concentration factor.
+    
+    Args:
+        values: Property values over temperature in °C
+        factors: Concentration factors over concentration in %, or None
+        temperature: Temperature in °C
+        concentration: Concentration percentage (0-100), or None
+        
+    Returns:
+        Property value
+    """
+    value = _eval_linear(values, temperature)
+    if factors is not None and concentration and concentration > 0:
+        value *= _eval_linear(factors, concentration)
+    return value
+
+# Python types accepted for each JSON schema primitive type
+_JSON_TYPES = {
+    'object': (dict, MappingProxyType),
+    'array': (list, tuple),
+    'string': (str,),
+    'number': (int, float),
+    'integer': (int,),
+    'boolean': (bool,),
+}
+
+
+def _quick_validate(instance: Any, schema: Mapping[str, Any]) -> bool:
+    """
+    Cheaply check an instance against the simple subset of JSON schema used here.
+    
+    Only ``type``, ``properties``, ``required`` and ``items`` are checked.
+    A True result means the instance passes those keywords; a False result
+    means the full validator should be run to report the problem.
+    
+    Args:
+        instance: Value to check
+        schema: Schema (or sub-schema) to check against
+        
+    Returns:
+        True if the instance passes the quick checks, False otherwise
+    """
+    expected = schema.get('type')
+    if expected is not None:
+        if not isinstance(instance, _JSON_TYPES[expected]):
+            return False
+        # bool is an int subclass but is not a JSON number
+        if expected in ('number', 'integer') and isinstance(instance, bool):
+            return False
+    
+    if isinstance(instance, (dict, MappingProxyType)):
+        for key in schema.get('required', ()):
+            if key not in instance:
+                return False
+        for key, subschema in schema.get('properties', {}).items():
+            if key in instance and not _quick_validate(instance[key], subschema):
+                return False
+    elif isinstance(instance, (list, tuple)) and 'items' in schema:
+        items = schema['items']
+        for item in instance:
+            if not _quick_validate(item, items):
+                return False
+    
+    return True
+
+# String fields repeated across many records; interned so that equal values
+# share one object and compare by identity in dict lookups and filters
+_INTERNED_PRODUCT_FIELDS = ('id', 'rack_type', 'series', 'part_number')
+_INTERNED_VALVE_FIELDS = ('type', 'size')
+_INTERNED_SPEC_FIELDS = ('model', 'control_type')
+_INTERNED_REGIONAL_FIELDS = ('default_fluid', 'efficiency_metric', 'preferred_units',
+                             'free_cooling_potential', 'dew_point_concerns')
+
+
+def _intern_fields(record: Dict[str, Any], fields: Sequence[str]) -> None:
+    """Intern the string values of the given fields in place."""
+    for field in fields:
+        value = record.get(field)
+        if isinstance(value, str):
+            record[field] = sys.intern(value)
+
+
+def _intern_product_strings(products: Sequence[Dict[str, Any]]) -> None:
+    """Intern repeated string values in freshly parsed product records."""
+    for product in products:
+        _intern_fields(product, _INTERNED_PRODUCT_FIELDS)
+        for valve in product.get('valve_options', []):
+            _intern_fields(valve, _INTERNED_VALVE_FIELDS)
+        for key in ('fan_specs', 'controller_specs'):
+            if isinstance(product.get(key), dict):
+                _intern_fields(product[key], _INTERNED_SPEC_FIELDS)
+
+
+def _intern_regional_strings(settings: Dict[str, Any]) -> None:
+    """Intern repeated string values in regional settings, including subregions."""
+    _intern_fields(settings, _INTERNED_REGIONAL_FIELDS)
+    for value in settings.values():
+        if isinstance(value, dict):
+            _intern_regional_strings(value)
+
 # Product Database Schema
 PRODUCT_SCHEMA = {
     "type": "object",
@@ -227,6 +471,157 @@ FLUID_PROPERTIES_SCHEMA = {
     "required": ["name", "temperatures", "properties"]
 }
 
+class CoilGeometry(NamedTuple):
+    """Typed view of a product's coil geometry."""
+    tube_diameter: float
+    tube_length: float
+    tube_rows: int
+    fin_spacing: float
+    fin_thickness: float
+    fin_area: float
+    number_of_passes: int
+
+
+class FanSpecs(NamedTuple):
+    """Typed view of a product's fan specifications."""
+    model: str
+    nominal_air_flow: float
+    nominal_static_pressure: float
+    nominal_power: float
+    nominal_noise: float
+    max_air_flow: float
+    max_static_pressure: float
+
+
+class ControllerSpecs(NamedTuple):
+    """Typed view of a product's controller specifications."""
+    model: str
+    min_voltage: float
+    max_voltage: float
+    voltage_step: float
+    control_type: str
+
+
+class ValveOption(NamedTuple):
+    """Typed view of one valve option."""
+    type: str
+    size: str
+    max_flow_rate: float
+    kv_value: float
+
+
+class Dimensions(NamedTuple):
+    """Typed view of a product's dimensions (mm and kg)."""
+    height: float
+    width: float
+    depth: float
+    weight: Optional[float]
+
+
+class ProductRecord(NamedTuple):
+    """
+    Typed, immutable view of a product.
+    
+    Built once when the product database is loaded so hot paths can use
+    attribute access instead of nested dictionary lookups.
+    """
+    id: str
+    name: str
+    rack_type: str
+    max_cooling_capacity: float
+    number_of_fans: int
+    coil_geometry: Optional[CoilGeometry]
+    fan_specs: Optional[FanSpecs]
+    controller_specs: Optional[ControllerSpecs]
+    valve_options: Tuple[ValveOption, ...]
+    dimensions: Optional[Dimensions]
+    part_number: Optional[str]
+    fast_track: bool
+
+
+def _compile_record(record_type: type, data: Optional[Dict[str, Any]]) -> Any:
+    """Build a NamedTuple from a dictionary, using None for missing fields."""
+    if data is None:
+        return None
+    return record_type(*(data.get(field) for field in record_type._fields))
+
+
+def _compile_product(product: Dict[str, Any]) -> ProductRecord:
+    """
+    Compile a product dictionary into a ProductRecord.
+    
+    Args:
+        product: Product dictionary conforming to PRODUCT_SCHEMA
+        
+    Returns:
+        Typed product record
+    """
+    dimensions = product.get('dimensions')
+    if dimensions is not None:
+        dimensions = Dimensions(
+            dimensions.get('height'),
+            dimensions.get('width'),
+            dimensions.get('depth'),
+            dimensions.get('weight', dimensions.get('wet_weight'))
+        )
+    
+    return ProductRecord(
+        id=product['id'],
+        name=product.get('name'),
+        rack_type=product.get('rack_type'),
+        max_cooling_capacity=product.get('max_cooling_capacity', 0),
+        number_of_fans=product.get('number_of_fans', 0),
+        coil_geometry=_compile_record(CoilGeometry, product.get('coil_geometry')),
+        fan_specs=_compile_record(FanSpecs, product.get('fan_specs')),
+        controller_specs=_compile_record(ControllerSpecs, product.get('controller_specs')),
+        valve_options=tuple(_compile_record(ValveOption, valve)
+                            for valve in product.get('valve_options', [])),
+        dimensions=dimensions,
+        part_number=product.get('part_number'),
+        fast_track=bool(product.get('fast_track', False))
+    )
+
+class RegionalSettings(ChainMap):
+    """
+    Read-only layered view of regional settings.
+    
+    Layers are ordered from most to least specific (subregion, region,
+    global). Lookups walk the layers without copying anything; a nested
+    dictionary present in several layers is merged the same way on access,
+    matching a deep update of global <- region <- subregion. Lists inside
+    the settings are shared with the database and must not be mutated.
+    Call ``materialize()`` for an independent, mutable dictionary.
+    """
+    
+    def __init__(self, *maps: Mapping[str, Any]):
+        super().__init__(*(m if isinstance(m, MappingProxyType) else MappingProxyType(m)
+                           for m in maps))
+    
+    def __getitem__(self, key: str) -> Any:
+        layers = []
+        for mapping in self.maps:
+            if key not in mapping:
+                continue
+            value = mapping[key]
+            if not isinstance(value, Mapping):
+                # A scalar in a more specific layer replaces everything below it
+                return value if not layers else RegionalSettings(*layers)
+            layers.append(value)
+        
+        if not layers:
+            return self.__missing__(key)
+        return RegionalSettings(*layers)
+    
+    def materialize(self) -> Dict[str, Any]:
+        """
+        Build a plain, deep-merged dictionary of these settings.
+        
+        Returns:
+            Mutable dictionary independent of the database
+        """
+        return thaw(self)
+
+
 class DatabaseManager:
     """
     Manages the database for the cooling calculator.
@@ -249,19 +644,43 @@ class DatabaseManager:
         self.regional_data = {}
         self.fluid_properties = {}
         
+        # Typed product records keyed by ID, rebuilt on every load
+        self.product_records = {}
+        
+        # Columnar view of the flat product fields, rebuilt on every load
+        self._product_columns = self._build_product_columns()
+        
+        # Interpolation tables keyed by (fluid name, property name)
+        self._property_tables = {}
+        
+        # (mtime, size) of each database file at its last successful load
+        self._file_stamps = {}
+        
         # Validator function
         self.validator = None
+        
+        # Run the full validator on every product, not only on records that
+        # fail the quick structural checks
+        self.strict_validation = False
     
     def load_databases(self) -> bool:
         """
         Load all databases.
         
+        The three files are independent, so they are read and parsed
+        concurrently to overlap file I/O with JSON parsing.
+        
         Returns:
             True if all databases loaded successfully, False otherwise
         """
-        products_loaded = self.load_product_database('products.json')
-        regional_loaded = self.load_regional_database('regional_settings.json')
-        fluids_loaded = self.load_fluid_properties('fluid_properties.json')
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            products_future = executor.submit(self.load_product_database, 'products.json')
+            regional_future = executor.submit(self.load_regional_database, 'regional_settings.json')
+            fluids_future = executor.submit(self.load_fluid_properties, 'fluid_properties.json')
+            
+            products_loaded = products_future.result()
+            regional_loaded = regional_future.result()
+            fluids_loaded = fluids_future.result()
         
         return products_loaded and regional_loaded and fluids_loaded
     
@@ -280,20 +699,27 @@ class DatabaseManager:
         filepath = os.path.join(self.data_dir, filename)
         
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            stamp = self._file_stamp(filepath)
+            if self.products and self._file_stamps.get(filepath) == stamp:
+                logger.info(f"{filename} unchanged since last load, reusing parsed data")
+                return True
             
-            # Validate data
-            if self.validator:
-                # If jsonschema validator is available, use it
-                self.validator.validate(data, PRODUCT_SCHEMA)
+            # Build the dictionary one product at a time, validating each record
+            products = {}
+            for product_id, product in self._iter_product_file(filepath):
+                if self.validator and (self.strict_validation
+                                       or not _quick_validate(product, PRODUCT_SCHEMA)):
+                    # If jsonschema validator is available, use it
+                    self.validator.validate(product, PRODUCT_SCHEMA)
+                _intern_product_strings((product,))
+                products[sys.intern(product_id)] = product
+            self.products = products
             
-            # Convert list to dictionary with id as key
-            if isinstance(data, list):
-                self.products = {product['id']: product for product in data}
-            else:
-                self.products = data
+            self.product_records = {product_id: _compile_product(product)
+                                    for product_id, product in self.products.items()}
+            self._product_columns = self._build_product_columns()
                 
+            self._file_stamps[filepath] = stamp
             logger.info(f"Loaded {len(self.products)} products")
             return True
             
@@ -316,14 +742,20 @@ class DatabaseManager:
         filepath = os.path.join(self.data_dir, filename)
         
         try:
-            with open(filepath, 'r') as f:
-                self.regional_data = json.load(f)
+            stamp = self._file_stamp(filepath)
+            if self.regional_data and self._file_stamps.get(filepath) == stamp:
+                logger.info(f"{filename} unchanged since last load, reusing parsed data")
+                return True
+            
+            self.regional_data = _load_json(filepath)
+            _intern_regional_strings(self.regional_data)
             
             # Validate data
             if self.validator:
                 # If jsonschema validator is available, use it
                 self.validator.validate(self.regional_data, REGIONAL_SCHEMA)
                 
+            self._file_stamps[filepath] = stamp
             logger.info(f"Loaded regional settings for {len(self.regional_data) - 1} regions")  # -1 for 'global'
             return True
             
@@ -346,21 +778,32 @@ class DatabaseManager:
         filepath = os.path.join(self.data_dir, filename)
         
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            stamp = self._file_stamp(filepath)
+            if self.fluid_properties and self._file_stamps.get(filepath) == stamp:
+                logger.info(f"{filename} unchanged since last load, reusing parsed data")
+                return True
+            
+            data = _load_json(filepath)
             
             # Validate data
             if self.validator:
                 # If jsonschema validator is available, use it
                 for fluid in data:
+                    key = _fluid_content_hash(fluid)
+                    if key in _VALIDATED_FLUIDS:
+                        continue
                     self.validator.validate(fluid, FLUID_PROPERTIES_SCHEMA)
+                    _VALIDATED_FLUIDS.add(key)
             
             # Convert list to dictionary with name as key
             if isinstance(data, list):
-                self.fluid_properties = {fluid['name']: fluid for fluid in data}
+                self.fluid_properties = {sys.intern(fluid['name']): fluid for fluid in data}
             else:
                 self.fluid_properties = data
+            
+            self._property_tables = self._build_property_tables()
                 
+            self._file_stamps[filepath] = stamp
             logger.info(f"Loaded properties for {len(self.fluid_properties)} fluids")
             return True
             
@@ -368,6 +811,51 @@ class DatabaseManager:
             logger.error(f"Error loading fluid properties: {str(e)}")
             return False
     
+    def _iter_product_file(self, filepath: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Iterate over the products in a product database file.
+        
+        The file may hold a list of products or a dictionary keyed by ID.
+        When ijson is installed the file is streamed, so only one product is
+        materialized at a time; otherwise it is parsed whole with _load_json.
+        
+        Args:
+            filepath: Path to the product database file
+            
+        Yields:
+            Tuples of (product ID, product dictionary)
+        """
+        if ijson is None:
+            data = _load_json(filepath)
+            if isinstance(data, list):
+                for product in data:
+                    yield product['id'], product
+            else:
+                yield from data.items()
+            return
+        
+        with open(filepath, 'rb') as f:
+            is_list = f.read(64).lstrip()[:1] == b'['
+            f.seek(0)
+            if is_list:
+                for product in ijson.items(f, 'item', use_float=True):
+                    yield product['id'], product
+            else:
+                yield from ijson.kvitems(f, '', use_float=True)
+    
+    def _file_stamp(self, filepath: str) -> Tuple[int, int]:
+        """
+        Get the modification stamp of a database file.
+        
+        Args:
+            filepath: Path to the file
+            
+        Returns:
+            Tuple of (mtime in nanoseconds, size in bytes)
+        """
+        st = os.stat(filepath)
+        return (st.st_mtime_ns, st.st_size)
+    
     def get_product(self, product_id: str) -> Optional[Dict[str, Any]]:
         """
         Get product by ID.
@@ -380,6 +868,18 @@ class DatabaseManager:
         """
         return self.products.get(product_id)
     
+    def get_product_record(self, product_id: str) -> Optional[ProductRecord]:
+        """
+        Get the typed record for a product.
+        
+        Args:
+            product_id: Product ID
+            
+        Returns:
+            ProductRecord or None if not found
+        """
+        return self.product_records.get(product_id)
+    
     def get_products_by_rack_type(self, rack_type: str) -> List[Dict[str, Any]]:
         """
         Get products by rack type.
@@ -390,8 +890,10 @@ class DatabaseManager:
         Returns:
             List of product dictionaries
         """
-        return [product for product in self.products.values() 
-                if product.get('rack_type') == rack_type]
+        columns = self._product_columns
+        return [self.products[product_id]
+                for product_id, product_rack_type in zip(columns['id'], columns['rack_type'])
+                if product_rack_type == rack_type]
     
     def get_fast_track_products(self) -> List[Dict[str, Any]]:
         """
@@ -400,31 +902,38 @@ class DatabaseManager:
         Returns:
             List of fast track product dictionaries
         """
-        return [product for product in self.products.values() 
-                if product.get('fast_track', False)]
+        columns = self._product_columns
+        return [self.products[product_id]
+                for product_id, fast_track in zip(columns['id'], columns['fast_track'])
+                if fast_track]
     
-    def get_regional_settings(self, region: str, subregion: Optional[str] = None) -> Dict[str, Any]:
+    def get_regional_settings(self, region: str, subregion: Optional[str] = None) -> RegionalSettings:
         """
         Get regional settings.
         
+        Returns a read-only layered view over the loaded data instead of a
+        merged copy. Use ``materialize()`` on the result for a mutable
+        dictionary.
+        
         Args:
             region: Region name
             subregion: Subregion name (optional)
             
         Returns:
-            Dictionary containing regional settings
+            RegionalSettings view containing regional settings
         """
-        settings = self.regional_data.get('global', {}).copy()
+        maps = [self.regional_data.get('global', {})]
         
         if region in self.regional_data:
-            # Update with region-specific settings
-            self._deep_update(settings, self.regional_data[region])
+            # Region-specific settings take precedence over global ones
+            region_data = self.regional_data[region]
+            maps.insert(0, region_data)
             
-            # Update with subregion-specific settings if applicable
-            if subregion and isinstance(self.regional_data[region], dict) and subregion in self.regional_data[region]:
-                self._deep_update(settings, self.regional_data[region][subregion])
+            # Subregion-specific settings take precedence over both
+            if subregion and isinstance(region_data, dict) and subregion in region_data:
+                maps.insert(0, region_data[subregion])
         
-        return settings
+        return RegionalSettings(*maps)
     
     def get_fluid_properties(self, fluid_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -453,42 +962,62 @@ class DatabaseManager:
         Returns:
             Property value or None if not found
         """
-        fluid = self.get_fluid_properties(fluid_name)
-        if not fluid:
+        table = self._property_tables.get((fluid_name, property_name))
+        if table is None:
             return None
         
-        # Get property values at different temperatures
-        if property_name not in fluid.get('properties', {}):
-            return None
-            
-        property_values = fluid['properties'][property_name]
-        temperatures = fluid.get('temperatures', [])
+        return _interp_with_factor(*table, temperature, concentration)
+    
+    def _build_product_columns(self) -> Dict[str, tuple]:
+        """
+        Build a column-oriented view of the flat product fields.
         
-        if not property_values or not temperatures or len(property_values) != len(temperatures):
-            return None
-            
-        # Interpolate property value at the specified temperature
-        property_value = self._interpolate(temperatures, property_values, temperature)
-        
-        # Apply concentration factor if applicable
-        if concentration and concentration > 0 and 'concentration_factors' in fluid:
-            # Get concentration factors
-            if property_name not in fluid['concentration_factors']:
-                return property_value
-                
-            concentration_factors = fluid['concentration_factors'][property_name]
+        Filters scan one tuple per field instead of walking every product
+        dictionary; nested records stay in ``self.products`` keyed by ID.
+        
+        Returns:
+            Dictionary mapping field name to a tuple of values in product order
+        """
+        records = list(self.product_records.values())
+        return {
+            'id': tuple(record.id for record in records),
+            'rack_type': tuple(record.rack_type for record in records),
+            'fast_track': tuple(record.fast_track for record in records),
+            'max_cooling_capacity': tuple(record.max_cooling_capacity for record in records),
+            'number_of_fans': tuple(record.number_of_fans for record in records),
+        }
+    
+    def _build_property_tables(self) -> Dict[Tuple[str, str], tuple]:
+        """
+        Pre-build the interpolation tables for every fluid property.
+        
+        Interval slopes are computed here once, so a query only locates the
+        interval and does one multiply-add per table. Properties with missing
+        or mismatched tables are left out, so lookups for them return None.
+        Concentration data is attached only when it is complete for that
+        property.
+        
+        Returns:
+            Dictionary mapping (fluid, property) to (values, factors) tables
+        """
+        tables = {}
+        for name, fluid in self.fluid_properties.items():
+            temperatures = fluid.get('temperatures', [])
             concentrations = fluid.get('concentrations', [])
+            factor_tables = fluid.get('concentration_factors', {})
             
-            if not concentration_factors or not concentrations or len(concentration_factors) != len(concentrations):
-                return property_value
+            for property_name, values in fluid.get('properties', {}).items():
+                if not values or not temperatures or len(values) != len(temperatures):
+                    continue
                 
-            # Interpolate concentration factor
-            factor = self._interpolate(concentrations, concentration_factors, concentration)
-            
-            # Apply factor
-            property_value *= factor
-        
-        return property_value
+                factors = factor_tables.get(property_name)
+                if not factors or not concentrations or len(factors) != len(concentrations):
+                    factor_table = None
+                else:
+                    factor_table = _linear_table(concentrations, factors)
+                
+                tables[(name, property_name)] = (_linear_table(temperatures, values), factor_table)
+        return tables
     
     def _interpolate(self, x_values: List[float], y_values: List[float], x: float) -> float:
         """
@@ -502,44 +1031,7 @@ class DatabaseManager:
         Returns:
             Interpolated y value
         """
-        # Check if x is below the range
-        if x <= x_values[0]:
-            return y_values[0]
-            
-        # Check if x is above the range
-        if x >= x_values[-1]:
-            return y_values[-1]
-            
-        # Find the two closest x values
-        for i in range(len(x_values) - 1):
-            if x_values[i] <= x <= x_values[i + 1]:
-                # Linear interpolation
-                x1, x2 = x_values[i], x_values[i + 1]
-                y1, y2 = y_values[i], y_values[i + 1]
-                
-                return y1 + (y2 - y1) * (x - x1) / (x2 - x1)
-        
-        # This should not happen
-        return y_values[0]
-    
-    def _deep_update(self, d: Dict[str, Any], u: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Deep update a dictionary.
-        
-        Args:
-            d: Dictionary to update
-            u: Dictionary with updates
-            
-        Returns:
-            Updated dictionary
-        """
-        for k, v in u.items():
-            if isinstance(v, dict) and k in d and isinstance(d[k], dict):
-                self._deep_update(d[k], v)
-            else:
-                d[k] = v
-                
-        return d
+        return _interpolate(x_values, y_values, x)
 
 # Sample Product Database
 SAMPLE_PRODUCT_DATABASE = [
@@ -926,3 +1418,9 @@ SAMPLE_FLUID_PROPERTIES = [
         "freezing_points": [0, -3, -7, -13, -21, -33, -48]  # °C
     }
 ]
+
+# Sample data is shared read-only; use thaw() for a mutable copy. The schemas
+# stay plain dicts because jsonschema only accepts dict and list schemas.
+SAMPLE_PRODUCT_DATABASE = _freeze(SAMPLE_PRODUCT_DATABASE)
+SAMPLE_REGIONAL_SETTINGS = _freeze(SAMPLE_REGIONAL_SETTINGS)
+SAMPLE_FLUID_PROPERTIES = _freeze(SAMPLE_FLUID_PROPERTIES)
@@ -7,31 +7,105 @@ This module implements the main calculator logic that integrates all the compone
 selects appropriate models, and produces comprehensive results.
 """
 
+import bisect
 import logging
+from functools import lru_cache, partial
 import json
 import os
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, NamedTuple, Optional, Sequence, Tuple, Union
 
-from database.product_data import COLDLOGIK_PRODUCTS, recommend_product
+import numpy as np
+
+from database.product_data import COLDLOGIK_BY_ID, CAPACITY_INDEX, recommend_product
 from database.schema import DatabaseManager
 from calculations.cooling_models import ActiveCoolingModel, PassiveCoolingModel, HPCCoolingModel
-from utils.unit_conversion import convert_temperature, convert_power, convert_flow_rate
-from utils.report_generator import generate_technical_report, generate_commercial_report
+from calculations.fluid_properties import fluid_properties_at
 from utils.validation import validate_input_parameters
-from api.app import create_api_app
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("calculator.log"),
-        logging.StreamHandler()
-    ]
-)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+
+class FluidProperties(NamedTuple):
+    """Nominal properties of a cooling fluid."""
+    density: float  # kg/m³
+    specific_heat: float  # kJ/kg·K
+    viscosity: float  # Pa·s
+    thermal_conductivity: float  # W/m·K
+
+
+# Nominal properties of the supported cooling fluids
+FLUID_PROPS = {
+    "water": FluidProperties(998.0, 4.182, 0.001, 0.6),
+    "ethylene_glycol": FluidProperties(1120.0, 2.4, 0.016, 0.25),
+    "propylene_glycol": FluidProperties(1040.0, 2.5, 0.04, 0.2)
+}
+
+# Linear glycol mixture coefficients per property, in FluidProperties order
+GLYCOL_COEFFICIENTS = {
+    "ethylene_glycol": (0.13, -0.45, 10.0, -0.3),
+    "propylene_glycol": (0.06, -0.4, 15.0, -0.35)
+}
+
+# Maximum number of cached cooling models per calculator and fluid
+MODEL_CACHE_SIZE = 256
+
+# Unit conversion factors
+KW_PER_TON = 3.5168525  # kW per ton of refrigeration
+M3H_PER_GPM = 0.2271247  # m³/h per US gallon per minute
+C_PER_F = 5.0 / 9.0  # °C per °F temperature difference
+F_PER_C = 9.0 / 5.0
+PSI_PER_KPA = 0.145038
+CFM_PER_M3H = 0.589
+INWC_PER_PA = 0.00401463
+IN_PER_MM = 0.0393701
+LBS_PER_KG = 2.20462
+
+
+@lru_cache(maxsize=2048)
+def _imperial_to_metric(cooling_kw: float, room_temp: float, desired_temp: float,
+                        water_temp: float) -> Tuple[float, float, float, float]:
+    """
+    Convert the main calculation inputs from imperial to metric units.
+    
+    Cached, since interactive and sweep callers repeat the same inputs.
+    
+    Args:
+        cooling_kw: Cooling capacity in tons
+        room_temp: Room temperature in °F
+        desired_temp: Desired room temperature in °F
+        water_temp: Water supply temperature in °F
+        
+    Returns:
+        Tuple of (cooling capacity in kW, room, desired and water temperatures in °C)
+    """
+    return (
+        cooling_kw * KW_PER_TON,
+        (room_temp - 32.0) * C_PER_F,
+        (desired_temp - 32.0) * C_PER_F,
+        (water_temp - 32.0) * C_PER_F
+    )
+
+
+def _scale_fields(data: Dict[str, Any], keys: tuple, factor: float, unit: str) -> None:
+    """
+    Scale the given fields of a result dictionary in place.
+    
+    Args:
+        data: Result dictionary to update
+        keys: Fields to scale if present
+        factor: Conversion factor
+        unit: Unit label stored as <key>_unit unless one is already set
+    """
+    for key in keys:
+        if key in data:
+            data[key] *= factor
+            data.setdefault(key + "_unit", unit)
+
 class DataCenterCoolingCalculator:
     """
     Main calculator class that integrates all components.
@@ -49,32 +123,23 @@ class DataCenterCoolingCalculator:
         """
         self.data_dir = data_dir
         
-        # Load fluid properties
-        self.fluid_properties = {
-            "water": {
-                "density": 998.0,  # kg/m³
-                "specific_heat": 4.182,  # kJ/kg·K
-                "viscosity": 0.001,  # Pa·s
-                "thermal_conductivity": 0.6  # W/m·K
-            },
-            "ethylene_glycol": {
-                "density": 1120.0,  # kg/m³
-                "specific_heat": 2.4,  # kJ/kg·K
-                "viscosity": 0.016,  # Pa·s
-                "thermal_conductivity": 0.25  # W/m·K
-            },
-            "propylene_glycol": {
-                "density": 1040.0,  # kg/m³
-                "specific_heat": 2.5,  # kJ/kg·K
-                "viscosity": 0.04,  # Pa·s
-                "thermal_conductivity": 0.2  # W/m·K
-            }
+        # Shared nominal fluid properties
+        self.fluid_properties = FLUID_PROPS
+        
+        # Shared read-only product database
+        self.products = COLDLOGIK_BY_ID
+        
+        # Model getters specialized per supported fluid, each with its own cache
+        # of cooling models keyed by (product ID, glycol %, fluid temperature)
+        self._model_getters = {
+            fluid_type: partial(self._get_model, fluid_type, base_properties, {})
+            for fluid_type, base_properties in FLUID_PROPS.items()
         }
         
-        # Initialize product database
-        self.products = {product["id"]: product for product in COLDLOGIK_PRODUCTS}
+        # Path prefixes of the report directories already created by this calculator
+        self._report_dirs = {}
         
-        logger.info(f"Initialized DataCenterCoolingCalculator with {len(self.products)} products")
+        logger.debug("Initialized DataCenterCoolingCalculator with %d products", len(self.products))
     
     def calculate(self, cooling_kw: float, room_temp: float, desired_temp: float, 
                  water_temp: float, **kwargs) -> Dict[str, Any]:
@@ -92,6 +157,8 @@ class DataCenterCoolingCalculator:
                 - passive_preferred: Whether to prefer passive cooling
                 - fluid_type: Type of cooling fluid
                 - glycol_percentage: Percentage of glycol in mixture
+                - fluid_temperature: Fluid temperature in °C at which to evaluate
+                  tabulated fluid properties (default: nominal properties)
                 - flow_rate: Water flow rate in m³/h
                 - return_water_temp: Water return temperature in °C
                 - fan_speed_percentage: Fan speed as percentage
@@ -109,16 +176,15 @@ class DataCenterCoolingCalculator:
         """
         # Convert units if using imperial
         if kwargs.get("units") == "imperial":
-            cooling_kw = convert_power(cooling_kw, "ton", "kw")
-            room_temp = convert_temperature(room_temp, "f", "c")
-            desired_temp = convert_temperature(desired_temp, "f", "c")
-            water_temp = convert_temperature(water_temp, "f", "c")
+            cooling_kw, room_temp, desired_temp, water_temp = _imperial_to_metric(
+                cooling_kw, room_temp, desired_temp, water_temp
+            )
             
             if "flow_rate" in kwargs:
-                kwargs["flow_rate"] = convert_flow_rate(kwargs["flow_rate"], "gpm", "m3h")
+                kwargs["flow_rate"] *= M3H_PER_GPM
             
             if "return_water_temp" in kwargs:
-                kwargs["return_water_temp"] = convert_temperature(kwargs["return_water_temp"], "f", "c")
+                kwargs["return_water_temp"] = (kwargs["return_water_temp"] - 32.0) * C_PER_F
         
         # Validate input parameters
         validation_result = validate_input_parameters(
@@ -143,46 +209,24 @@ class DataCenterCoolingCalculator:
             if not product:
                 return {"error": "No suitable product found for the specified requirements"}
         
-        logger.info(f"Selected product: {product['name']} (ID: {product['id']})")
+        logger.debug("Selected product: %s (ID: %s)", product["name"], product["id"])
         
         # Determine fluid properties
         fluid_type = kwargs.get("fluid_type", "water")
         glycol_percentage = kwargs.get("glycol_percentage", 0)
         
-        if fluid_type not in self.fluid_properties:
+        get_model = self._model_getters.get(fluid_type)
+        if get_model is None:
             return {"error": f"Unsupported fluid type: {fluid_type}"}
         
-        # Adjust fluid properties for glycol mixture
-        fluid_properties = self._adjust_fluid_properties(
-            self.fluid_properties[fluid_type],
-            fluid_type,
-            glycol_percentage
-        )
-        
-        # Create appropriate cooling model based on product series
-        series = product.get("series", "")
-        if series == "CL21":
-            # Passive cooling model
-            model = PassiveCoolingModel(product, fluid_properties)
-        elif series == "CL23":
-            # HPC cooling model
-            model = HPCCoolingModel(product, fluid_properties)
-        else:
-            # Standard active cooling model
-            model = ActiveCoolingModel(product, fluid_properties)
+        # Get the cooling model for this product and fluid
+        model = get_model(product, glycol_percentage, kwargs.get("fluid_temperature"))
         
         # Perform calculation
         result = model.calculate(cooling_kw, room_temp, desired_temp, water_temp, **kwargs)
         
         # Add product information to result
-        result["product"] = {
-            "id": product["id"],
-            "name": product["name"],
-            "series": product.get("series", ""),
-            "rack_type": product.get("rack_type", ""),
-            "dimensions": product.get("dimensions", {}),
-            "max_cooling_capacity": product.get("max_cooling_capacity", 0)
-        }
+        result["product"] = self._product_summary(product)
         
         # Convert back to imperial units if requested
         if kwargs.get("units") == "imperial":
@@ -190,22 +234,113 @@ class DataCenterCoolingCalculator:
         
         # Generate reports if requested
         if kwargs.get("generate_reports", False):
+            from utils.report_generator import generate_technical_report, generate_commercial_report
+            
             report_dir = kwargs.get("report_dir", "./reports")
-            os.makedirs(report_dir, exist_ok=True)
+            report_prefix = self._report_dirs.get(report_dir)
+            if report_prefix is None:
+                os.makedirs(report_dir, exist_ok=True)
+                report_prefix = self._report_dirs[report_dir] = os.path.join(report_dir, "")
             
             # Generate technical report
-            tech_report_path = os.path.join(report_dir, f"technical_report_{product['id']}.pdf")
+            tech_report_path = f"{report_prefix}technical_report_{product['id']}.pdf"
             generate_technical_report(result, tech_report_path)
             result["technical_report_path"] = tech_report_path
             
             # Generate commercial report if included
             if "commercial" in result:
-                comm_report_path = os.path.join(report_dir, f"commercial_report_{product['id']}.pdf")
+                comm_report_path = f"{report_prefix}commercial_report_{product['id']}.pdf"
                 generate_commercial_report(result, comm_report_path)
                 result["commercial_report_path"] = comm_report_path
         
         return result
     
+    def calculate_many(self, cooling_kw: Union[float, Sequence[float]],
+                       room_temp: Union[float, Sequence[float]],
+                       desired_temp: Union[float, Sequence[float]],
+                       water_temp: Union[float, Sequence[float]], **kwargs) -> List[Dict[str, Any]]:
+        """
+        Perform cooling calculations for many operating points, e.g. a parameter sweep.
+        
+        The four main inputs may each be a scalar or a sequence; they are
+        broadcast against each other. The optional parameters are the same as
+        for calculate and apply to every point. Unit conversion is done on the
+        whole arrays, and the product and cooling model are resolved once and
+        reused across points wherever they are the same. Report generation is
+        not supported in batch mode.
+        
+        Args:
+            cooling_kw: Required cooling capacity in kW
+            room_temp: Room temperature in °C
+            desired_temp: Desired room temperature in °C
+            water_temp: Water supply temperature in °C
+            **kwargs: Additional optional parameters (see calculate)
+            
+        Returns:
+            List of result dictionaries, one per operating point; points that
+            cannot be calculated get a dictionary with an "error" entry
+        """
+        cooling_kw, room_temp, desired_temp, water_temp = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(value, dtype=np.float64))
+              for value in (cooling_kw, room_temp, desired_temp, water_temp))
+        )
+        kwargs = {key: value for key, value in kwargs.items() if key != "generate_reports"}
+        
+        # Convert units if using imperial
+        imperial = kwargs.get("units") == "imperial"
+        if imperial:
+            cooling_kw = cooling_kw * KW_PER_TON
+            room_temp = (room_temp - 32.0) * C_PER_F
+            desired_temp = (desired_temp - 32.0) * C_PER_F
+            water_temp = (water_temp - 32.0) * C_PER_F
+            
+            if "flow_rate" in kwargs:
+                kwargs["flow_rate"] *= M3H_PER_GPM
+            
+            if "return_water_temp" in kwargs:
+                kwargs["return_water_temp"] = (kwargs["return_water_temp"] - 32.0) * C_PER_F
+        
+        points = list(zip(cooling_kw.ravel().tolist(), room_temp.ravel().tolist(),
+                          desired_temp.ravel().tolist(), water_temp.ravel().tolist()))
+        
+        fluid_type = kwargs.get("fluid_type", "water")
+        glycol_percentage = kwargs.get("glycol_percentage", 0)
+        fluid_temperature = kwargs.get("fluid_temperature")
+        
+        get_model = self._model_getters.get(fluid_type)
+        if get_model is None:
+            return [{"error": f"Unsupported fluid type: {fluid_type}"} for _ in points]
+        
+        product_id = kwargs.get("product_id")
+        fixed_product = self.products.get(product_id) if product_id else None
+        rack_type = kwargs.get("rack_type")
+        passive_preferred = kwargs.get("passive_preferred", False)
+        
+        results = []
+        for point in points:
+            validation_result = validate_input_parameters(*point, **kwargs)
+            if not validation_result["valid"]:
+                results.append({"error": validation_result["message"]})
+                continue
+            
+            product = fixed_product or recommend_product(point[0], rack_type, passive_preferred)
+            if not product:
+                results.append({"error": "No suitable product found for the specified requirements"})
+                continue
+            
+            model = get_model(product, glycol_percentage, fluid_temperature)
+            result = model.calculate(*point, **kwargs)
+            result["product"] = self._product_summary(product)
+            
+            if imperial:
+                result = self._convert_results_to_imperial(result)
+            
+            results.append(result)
+        
+        logger.info("Calculated %d operating points", len(points))
+        
+        return results
+    
     def recommend_products(self, cooling_kw: float, **kwargs) -> List[Dict[str, Any]]:
         """
         Recommend suitable products based on cooling requirements.
@@ -222,34 +357,23 @@ class DataCenterCoolingCalculator:
         """
         # Convert units if using imperial
         if kwargs.get("units") == "imperial":
-            cooling_kw = convert_power(cooling_kw, "ton", "kw")
+            cooling_kw *= KW_PER_TON
         
         # Get constraints
         rack_type = kwargs.get("rack_type")
         max_results = kwargs.get("max_results", 3)
         include_details = kwargs.get("include_details", False)
         
-        # Filter products by rack type if specified
-        candidates = list(self.products.values())
-        if rack_type:
-            candidates = [p for p in candidates if p.get("rack_type") == rack_type]
-        
-        # Find products that can handle the required cooling
-        suitable_products = [p for p in candidates if p.get("max_cooling_capacity", 0) >= cooling_kw]
-        
-        # If no suitable products, recommend products with highest capacity
-        if not suitable_products:
-            suitable_products = sorted(
-                candidates,
-                key=lambda p: p.get("max_cooling_capacity", 0),
-                reverse=True
-            )[:max_results]
+        # Products of the rack type sorted by capacity; the closest suitable
+        # products are the ones from the first capacity >= cooling_kw onwards
+        capacities, candidates = CAPACITY_INDEX.get(rack_type or None, ((), ()))
+        first_suitable = bisect.bisect_left(capacities, cooling_kw)
+        
+        if first_suitable < len(candidates):
+            suitable_products = candidates[first_suitable:first_suitable + max_results]
         else:
-            # Sort by appropriateness (closest capacity to requirement)
-            suitable_products = sorted(
-                suitable_products,
-                key=lambda p: abs(p.get("max_cooling_capacity", 0) - cooling_kw)
-            )[:max_results]
+            # No suitable products, recommend products with highest capacity
+            suitable_products = candidates[::-1][:max_results]
         
         # Prepare results
         recommendations = []
@@ -292,42 +416,114 @@ class DataCenterCoolingCalculator:
         """
         return list(self.products.values())
     
-    def _adjust_fluid_properties(self, base_properties: Dict[str, float],
-                                fluid_type: str, glycol_percentage: float) -> Dict[str, float]:
+    def _product_summary(self, product: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get the product information included in calculation results.
+        
+        Args:
+            product: Product data
+            
+        Returns:
+            Dictionary with the product's identification, size and capacity
+        """
+        return {
+            "id": product["id"],
+            "name": product["name"],
+            "series": product.get("series", ""),
+            "rack_type": product.get("rack_type", ""),
+            "dimensions": product.get("dimensions", {}),
+            "max_cooling_capacity": product.get("max_cooling_capacity", 0)
+        }
+    
+    def _get_model(self, fluid_type: str, base_properties: FluidProperties,
+                   model_cache: Dict[tuple, Any], product: Dict[str, Any],
+                   glycol_percentage: float, fluid_temperature: Optional[float] = None):
+        """
+        Get the cooling model for a product and fluid, reusing cached models.
+        
+        Models keep no per-calculation state (calculate() returns its results
+        without storing them), so one instance serves every calculation with
+        the same product and fluid configuration. The first
+        three arguments are bound per fluid in self._model_getters.
+        
+        Args:
+            fluid_type: Type of fluid
+            base_properties: Nominal properties of the fluid
+            model_cache: Cache of models for this fluid
+            product: Product data
+            glycol_percentage: Percentage of glycol (0-100)
+            fluid_temperature: Fluid temperature in °C (optional)
+            
+        Returns:
+            Cooling model for the product series
+        """
+        key = (product["id"], glycol_percentage, fluid_temperature)
+        model = model_cache.get(key)
+        if model is not None:
+            return model
+        
+        # Adjust fluid properties for glycol mixture
+        fluid_properties = self._adjust_fluid_properties(
+            base_properties,
+            fluid_type,
+            glycol_percentage,
+            fluid_temperature
+        )
+        
+        # Create appropriate cooling model based on product series
+        series = product.get("series", "")
+        if series == "CL21":
+            # Passive cooling model
+            model = PassiveCoolingModel(product, fluid_properties)
+        elif series == "CL23":
+            # HPC cooling model
+            model = HPCCoolingModel(product, fluid_properties)
+        else:
+            # Standard active cooling model
+            model = ActiveCoolingModel(product, fluid_properties)
+        
+        # Keep the cache bounded for callers sweeping continuous parameters
+        if len(model_cache) >= MODEL_CACHE_SIZE:
+            model_cache.clear()
+        model_cache[key] = model
+        return model
+    
+    def _adjust_fluid_properties(self, base_properties: FluidProperties,
+                                fluid_type: str, glycol_percentage: float,
+                                temperature: Optional[float] = None) -> Dict[str, float]:
         """
         Adjust fluid properties for glycol mixtures.
         
+        When a temperature is given, properties are interpolated from the
+        tabulated fluid data in both temperature and glycol percentage.
+        Otherwise the nominal base properties are scaled for the mixture.
+        
         Args:
             base_properties: Base fluid properties
             fluid_type: Type of fluid
             glycol_percentage: Percentage of glycol (0-100)
+            temperature: Fluid temperature in °C (optional)
             
         Returns:
-            Adjusted fluid properties
+            Dictionary of adjusted fluid properties, as the cooling models expect
         """
-        if fluid_type == "water" or glycol_percentage == 0:
-            return base_properties
+        if temperature is not None:
+            tabulated = fluid_properties_at(fluid_type, temperature, glycol_percentage)
+            if tabulated is not None:
+                return tabulated
         
-        # Simplified adjustment factors based on glycol percentage
+        coefficients = GLYCOL_COEFFICIENTS.get(fluid_type)
+        if coefficients is None or glycol_percentage == 0:
+            return base_properties._asdict()
+        
+        # Simplified adjustment: each property scales by (1 + coefficient * glycol fraction)
         # In a real implementation, this would use more detailed models
         glycol_factor = glycol_percentage / 100.0
         
-        if fluid_type == "ethylene_glycol":
-            return {
-                "density": base_properties["density"] * (1 + 0.13 * glycol_factor),
-                "specific_heat": base_properties["specific_heat"] * (1 - 0.45 * glycol_factor),
-                "viscosity": base_properties["viscosity"] * (1 + 10 * glycol_factor),
-                "thermal_conductivity": base_properties["thermal_conductivity"] * (1 - 0.3 * glycol_factor)
-            }
-        elif fluid_type == "propylene_glycol":
-            return {
-                "density": base_properties["density"] * (1 + 0.06 * glycol_factor),
-                "specific_heat": base_properties["specific_heat"] * (1 - 0.4 * glycol_factor),
-                "viscosity": base_properties["viscosity"] * (1 + 15 * glycol_factor),
-                "thermal_conductivity": base_properties["thermal_conductivity"] * (1 - 0.35 * glycol_factor)
-            }
-        
-        return base_properties
+        return {
+            name: value * (1 + coefficient * glycol_factor)
+            for name, value, coefficient in zip(FluidProperties._fields, base_properties, coefficients)
+        }
     
     def _convert_results_to_imperial(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -339,90 +535,110 @@ class DataCenterCoolingCalculator:
         Returns:
             Calculation results in imperial units
         """
-        # Create a deep copy of results to avoid modifying the original
-        import copy
-        imperial_results = copy.deepcopy(results)
+        # Copy only the dictionaries that are rewritten below; everything else
+        # is shared with the original results, which are left unmodified
+        imperial_results = dict(results)
         
         # Convert cooling capacity: kW to tons
         if "cooling_capacity" in imperial_results:
-            imperial_results["cooling_capacity"] = convert_power(
-                imperial_results["cooling_capacity"], "kw", "ton"
-            )
+            imperial_results["cooling_capacity"] /= KW_PER_TON
         
         # Convert water-side parameters
         if "water_side" in imperial_results:
-            water_side = imperial_results["water_side"]
+            water_side = imperial_results["water_side"] = dict(imperial_results["water_side"])
             
             # Convert flow rate: m³/h to GPM
             if "flow_rate" in water_side:
-                water_side["flow_rate"] = convert_flow_rate(
-                    water_side["flow_rate"], "m3h", "gpm"
-                )
+                water_side["flow_rate"] /= M3H_PER_GPM
                 water_side["flow_rate_unit"] = "GPM"
             
             # Convert temperatures: °C to °F
-            for key in ["supply_temp", "return_temp"]:
+            for key in ("supply_temp", "return_temp"):
                 if key in water_side:
-                    water_side[key] = convert_temperature(
-                        water_side[key], "c", "f"
-                    )
+                    water_side[key] = water_side[key] * F_PER_C + 32.0
             
             # Convert pressure: kPa to PSI
             if "pressure_drop" in water_side:
-                water_side["pressure_drop"] = water_side["pressure_drop"] * 0.145038
+                water_side["pressure_drop"] *= PSI_PER_KPA
                 water_side["pressure_drop_unit"] = "PSI"
         
         # Convert air-side parameters
         if "air_side" in imperial_results:
-            air_side = imperial_results["air_side"]
+            air_side = imperial_results["air_side"] = dict(imperial_results["air_side"])
             
             # Convert air flow: m³/h to CFM
-            for key in ["required_air_flow", "actual_air_flow", "min_air_flow", "max_air_flow"]:
-                if key in air_side:
-                    air_side[key] = air_side[key] * 0.589
-                    if key + "_unit" not in air_side:
-                        air_side[key + "_unit"] = "CFM"
+            _scale_fields(air_side, ("required_air_flow", "actual_air_flow", "min_air_flow", "max_air_flow"),
+                          CFM_PER_M3H, "CFM")
             
             # Convert pressure: Pa to inWC
-            for key in ["static_pressure", "door_pressure_drop", "server_pressure"]:
-                if key in air_side:
-                    air_side[key] = air_side[key] * 0.00401463
-                    if key + "_unit" not in air_side:
-                        air_side[key + "_unit"] = "inWC"
+            _scale_fields(air_side, ("static_pressure", "door_pressure_drop", "server_pressure"),
+                          INWC_PER_PA, "inWC")
                         
             # Convert actual cooling capacity if present
             if "actual_cooling_capacity" in air_side:
-                air_side["actual_cooling_capacity"] = convert_power(
-                    air_side["actual_cooling_capacity"], "kw", "ton"
-                )
+                air_side["actual_cooling_capacity"] /= KW_PER_TON
         
         # Convert valve data
         if "valve_recommendation" in imperial_results:
-            valve = imperial_results["valve_recommendation"]
+            valve = imperial_results["valve_recommendation"] = dict(imperial_results["valve_recommendation"])
             
             if "max_flow_rate" in valve:
-                valve["max_flow_rate"] = convert_flow_rate(
-                    valve["max_flow_rate"], "m3h", "gpm"
-                )
+                valve["max_flow_rate"] /= M3H_PER_GPM
                 valve["max_flow_rate_unit"] = "GPM"
         
         # Convert product dimensions
         if "product" in imperial_results and "dimensions" in imperial_results["product"]:
-            dims = imperial_results["product"]["dimensions"]
+            product = imperial_results["product"] = dict(imperial_results["product"])
+            dims = product["dimensions"] = dict(product["dimensions"])
             
-            for key in ["height", "width", "depth"]:
-                if key in dims:
-                    dims[key] = dims[key] * 0.0393701  # mm to inches
-                    if key + "_unit" not in dims:
-                        dims[key + "_unit"] = "in"
+            _scale_fields(dims, ("height", "width", "depth"), IN_PER_MM, "in")
             
             if "wet_weight" in dims:
-                dims["wet_weight"] = dims["wet_weight"] * 2.20462  # kg to lbs
+                dims["wet_weight"] *= LBS_PER_KG
                 dims["wet_weight_unit"] = "lbs"
         
         return imperial_results
 
 
+def _dumps(obj: Any) -> str:
+    """
+    Serialize results as indented JSON, using orjson when it is installed.
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+    return json.dumps(obj, indent=2, default=float)
+
+
+def _init_logging():
+    """
+    Set up logging for the command-line and API entry points.
+    
+    Logs go to the console; set TCALC_LOGFILE to also write them to a
+    rotating log file, which is only opened when the first record is written.
+    """
+    handlers = [logging.StreamHandler()]
+    
+    log_file = os.environ.get("TCALC_LOGFILE")
+    if log_file:
+        from logging.handlers import RotatingFileHandler
+        handlers.append(RotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024,
+                                            backupCount=3, delay=True))
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=handlers
+    )
+
+
 def create_calculator():
     """Create and initialize a calculator instance."""
     return DataCenterCoolingCalculator()
@@ -467,6 +683,8 @@ def main():
     
     args = parser.parse_args()
     
+    _init_logging()
+    
     # Create calculator
     calculator = create_calculator()
     
@@ -500,14 +718,18 @@ def main():
     # Output results
     if args.output:
         with open(args.output, 'w') as f:
-            json.dump(result, f, indent=2)
+            f.write(_dumps(result))
         print(f"Results saved to {args.output}")
     else:
-        print(json.dumps(result, indent=2))
+        print(_dumps(result))
 
 
 def start_api(host="0.0.0.0", port=5000, debug=False):
     """Start the API server."""
+    from api.app import create_api_app
+    
+    _init_logging()
+    
     app = create_api_app()
     app.run(host=host, port=port, debug=debug)
 
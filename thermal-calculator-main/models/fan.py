@@ -4,6 +4,34 @@ Fan model for the Data Center Cooling Calculator.
 
 import math
 
+import numpy as np
+
+# Converts flow rates from m³/h to m³/s
+_INV_3600 = 1.0 / 3600
+
+
+def _newton(f, fprime, x0, n=4):
+    """
+    Solve f(x) = 0 with a fixed number of Newton-Raphson steps
+    
+    Intended for inverting fan curves that have no closed-form inverse;
+    Newton converges quadratically from a reasonable starting point, and the
+    fixed step count keeps the cost predictable.
+    
+    Args:
+        f (callable): Function whose root is sought
+        fprime (callable): Derivative of f
+        x0 (float): Initial estimate
+        n (int): Number of iterations
+        
+    Returns:
+        float: Estimate of the root
+    """
+    x = x0
+    for _ in range(n):
+        x -= f(x) / fprime(x)
+    return x
+
 
 class Fan:
     """
@@ -20,6 +48,39 @@ class Fan:
         self.diameter = 200.0        # Fan diameter in mm
         self.quantity = 3            # Number of fans in the unit
         
+        # Tabulated full-speed fan curve per fan, set by from_table
+        self._table_pressures = None  # Static pressure in Pa, ascending
+        self._table_flows = None      # Air flow rate in m³/h
+    
+    @classmethod
+    def from_table(cls, pressures, flows):
+        """
+        Create a fan from a tabulated full-speed fan curve
+        
+        The maximum pressure and flow rate of the parametric model are taken
+        from the table, so the other methods stay usable.
+        
+        Args:
+            pressures (array-like): Static pressures in Pa
+            flows (array-like): Air flow rate per fan in m³/h at each pressure
+            
+        Returns:
+            Fan: Fan using the tabulated curve
+        """
+        pressures = np.asarray(pressures, dtype=float)
+        flows = np.asarray(flows, dtype=float)
+        if pressures.shape != flows.shape or pressures.ndim != 1 or len(pressures) < 2:
+            raise ValueError("Fan curve table needs matching 1-D pressure and flow arrays with at least two points")
+        
+        order = np.argsort(pressures)
+        
+        fan = cls()
+        fan._table_pressures = np.ascontiguousarray(pressures[order])
+        fan._table_flows = np.ascontiguousarray(flows[order])
+        fan.max_pressure = float(fan._table_pressures[-1])
+        fan.max_flow_rate = float(fan._table_flows.max())
+        return fan
+    
     def calculate_flow_at_pressure(self, static_pressure, speed_percentage):
         """
         Calculate air flow rate at a given static pressure and fan speed
@@ -64,9 +125,20 @@ class Fan:
         Returns:
             float: Power consumption in kW
         """
-        # Convert units
-        flow_rate_m3s = flow_rate / 3600  # m³/s
+        return self.calculate_power_si(flow_rate * _INV_3600, static_pressure, speed_percentage)
+    
+    def calculate_power_si(self, flow_rate_m3s, static_pressure, speed_percentage):
+        """
+        Calculate fan power consumption for a flow rate already in m³/s
         
+        Args:
+            flow_rate_m3s (float): Air flow rate in m³/s
+            static_pressure (float): Static pressure in Pa
+            speed_percentage (float): Fan speed as percentage of maximum (0-100)
+            
+        Returns:
+            float: Power consumption in kW
+        """
         # Adjust flow rate per fan
         flow_rate_per_fan = flow_rate_m3s / self.quantity
         
@@ -106,27 +178,16 @@ class Fan:
         # Calculate flow ratio compared to maximum
         flow_ratio = flow_per_fan / self.max_flow_rate
         
-        # Estimate speed percentage needed (iterative approach)
-        min_speed = 0.0
-        max_speed = 100.0
-        speed = 50.0
-        tolerance = 0.01
+        # Invert the fan curve flow = max_flow * s * sqrt(1 - P / (max_pressure * s²))
+        # for the speed ratio s: squaring gives s² = flow_ratio² + P / max_pressure
+        speed_ratio_squared = flow_ratio ** 2 + static_pressure / self.max_pressure
         
-        for _ in range(10):  # Maximum 10 iterations
-            current_flow = self.calculate_flow_at_pressure(static_pressure, speed) / self.quantity
-            
-            if abs(current_flow - flow_per_fan) < tolerance:
-                break
-            
-            if current_flow < flow_per_fan:
-                min_speed = speed
-                speed = (speed + max_speed) / 2
-            else:
-                max_speed = speed
-                speed = (speed + min_speed) / 2
+        # Required flow is not reachable even at full speed
+        if speed_ratio_squared >= 1.0:
+            return 100.0
         
         # Ensure the result is within valid range
-        speed = max(min(speed, 100.0), 0.0)
+        speed = max(math.sqrt(speed_ratio_squared) * 100.0, 0.0)
         
         return speed
     
@@ -160,6 +221,114 @@ class Fan:
         
         return static_pressure
     
+    def calculate_flow_at_pressure_array(self, static_pressure, speed_percentage):
+        """
+        Calculate air flow rates for arrays of static pressures and fan speeds
+        
+        Vectorized form of calculate_flow_at_pressure; the inputs are broadcast
+        against each other.
+        
+        Args:
+            static_pressure (array-like): Static pressure in Pa
+            speed_percentage (array-like): Fan speed as percentage of maximum (0-100)
+            
+        Returns:
+            numpy.ndarray: Air flow rate in m³/h (0 where the fan cannot overcome the pressure)
+        """
+        static_pressure = np.asarray(static_pressure, dtype=float)
+        speed_ratio = np.asarray(speed_percentage, dtype=float) / 100.0
+        
+        max_pressure_at_speed = self.max_pressure * speed_ratio ** 2
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            flow_ratio = np.sqrt(np.maximum(1 - static_pressure / max_pressure_at_speed, 0.0))
+        
+        flow_rate = self.max_flow_rate * speed_ratio * flow_ratio * self.quantity
+        
+        return np.where(static_pressure >= max_pressure_at_speed, 0.0, flow_rate)
+    
+    def calculate_pressure_from_flow_array(self, flow_rate, speed_percentage):
+        """
+        Calculate static pressures for arrays of flow rates and fan speeds
+        
+        Vectorized form of calculate_pressure_from_flow; the inputs are
+        broadcast against each other.
+        
+        Args:
+            flow_rate (array-like): Air flow rate in m³/h
+            speed_percentage (array-like): Fan speed as percentage of maximum (0-100)
+            
+        Returns:
+            numpy.ndarray: Static pressure in Pa (0 where the flow is out of reach)
+        """
+        flow_rate = np.asarray(flow_rate, dtype=float)
+        speed_ratio = np.asarray(speed_percentage, dtype=float) / 100.0
+        
+        max_pressure_at_speed = self.max_pressure * speed_ratio ** 2
+        max_flow_at_speed = self.max_flow_rate * speed_ratio * self.quantity
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            flow_ratio = flow_rate / max_flow_at_speed
+        
+        static_pressure = max_pressure_at_speed * (1 - flow_ratio ** 2)
+        
+        return np.where(flow_rate >= max_flow_at_speed, 0.0, static_pressure)
+    
+    def calculate_power_array(self, flow_rate, static_pressure, speed_percentage):
+        """
+        Calculate fan power consumption for arrays of operating points
+        
+        Vectorized form of calculate_power; the inputs are broadcast against
+        each other.
+        
+        Args:
+            flow_rate (array-like): Air flow rate in m³/h
+            static_pressure (array-like): Static pressure in Pa
+            speed_percentage (array-like): Fan speed as percentage of maximum (0-100)
+            
+        Returns:
+            numpy.ndarray: Power consumption in kW
+        """
+        flow_rate = np.asarray(flow_rate, dtype=float)
+        speed_ratio = np.asarray(speed_percentage, dtype=float) / 100.0
+        
+        # Hydraulic power over efficiency; the per-fan split and the fan count cancel out
+        total_power = flow_rate * _INV_3600 * np.asarray(static_pressure, dtype=float) / self.efficiency / 1000
+        power_by_speed = self.max_power * speed_ratio ** 3 * self.quantity
+        
+        return np.maximum(total_power, power_by_speed)
+    
+    def calculate_flow_at_pressure_table(self, static_pressure, speed_percentage=100.0):
+        """
+        Calculate air flow rates from the tabulated fan curve
+        
+        The full-speed curve is scaled with the fan laws (flow ∝ speed,
+        pressure ∝ speed²) and interpolated linearly. Without a table this
+        falls back to calculate_flow_at_pressure_array.
+        
+        Args:
+            static_pressure (array-like): Static pressure in Pa
+            speed_percentage (array-like): Fan speed as percentage of maximum (0-100)
+            
+        Returns:
+            numpy.ndarray: Air flow rate in m³/h (0 beyond the end of the curve)
+        """
+        if self._table_pressures is None:
+            return self.calculate_flow_at_pressure_array(static_pressure, speed_percentage)
+        
+        static_pressure = np.asarray(static_pressure, dtype=float)
+        speed_ratio = np.asarray(speed_percentage, dtype=float) / 100.0
+        
+        # Pressure on the full-speed curve with the same flow ratio
+        with np.errstate(divide="ignore", invalid="ignore"):
+            full_speed_pressure = static_pressure / speed_ratio ** 2
+        
+        flow_per_fan = np.interp(full_speed_pressure, self._table_pressures,
+                                 self._table_flows, right=0.0)
+        flow_rate = flow_per_fan * speed_ratio * self.quantity
+        
+        return np.where(speed_ratio > 0, flow_rate, 0.0)
+    
     def set_fan_specs(self, max_flow_rate=None, max_pressure=None, max_power=None, 
                      efficiency=None, diameter=None, quantity=None):
         """
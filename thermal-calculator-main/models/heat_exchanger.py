@@ -3,6 +3,108 @@ Heat exchanger model for the Data Center Cooling Calculator.
 """
 
 import math
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+# Properties of fluids
+WATER_DENSITY = 1000.0  # kg/m³
+WATER_SPECIFIC_HEAT = 4.18  # kJ/kg·K
+AIR_DENSITY = 1.2  # kg/m³
+AIR_SPECIFIC_HEAT = 1.005  # kJ/kg·K
+
+# Converts flow rates from m³/h to m³/s
+_INV_3600 = 1.0 / 3600
+
+# Heat capacity rate per unit volumetric flow, in kW/K per m³/h
+_WATER_HEAT_CAPACITY_PER_M3H = WATER_DENSITY * WATER_SPECIFIC_HEAT / 3600
+_AIR_HEAT_CAPACITY_PER_M3H = AIR_DENSITY * AIR_SPECIFIC_HEAT / 3600
+
+
+
+def _water_pressure_drop(water_flow_m3s, rows, fin_spacing):
+    """
+    Calculate water-side pressure drop through the heat exchanger
+    
+    Args:
+        water_flow_m3s (float or numpy.ndarray): Water flow rate in m³/s
+        rows (int): Number of tube rows
+        fin_spacing (float): Fin spacing in mm
+        
+    Returns:
+        float or numpy.ndarray: Pressure drop in kPa
+    """
+    # Reference conditions
+    reference_flow = 2.0 / 3600  # m³/s (2.0 m³/h)
+    reference_pressure_drop = 20.0  # kPa
+    
+    # Pressure drop is proportional to square of flow rate
+    pressure_drop = reference_pressure_drop * (water_flow_m3s / reference_flow) ** 2
+    
+    # Apply correction for number of rows (more rows = more pressure drop)
+    pressure_drop *= rows / 3.0
+    
+    # Apply correction for fin spacing (smaller spacing = more pressure drop)
+    pressure_drop *= 2.0 / fin_spacing
+    
+    return pressure_drop
+
+
+def _air_pressure_drop(air_flow_m3s, rows, fin_spacing):
+    """
+    Calculate air-side pressure drop through the heat exchanger
+    
+    Args:
+        air_flow_m3s (float or numpy.ndarray): Air flow rate in m³/s
+        rows (int): Number of tube rows
+        fin_spacing (float): Fin spacing in mm
+        
+    Returns:
+        float or numpy.ndarray: Pressure drop in Pa
+    """
+    # Reference conditions
+    reference_flow = 5000.0 / 3600  # m³/s (5000 m³/h)
+    reference_pressure_drop = 50.0  # Pa
+    
+    # Pressure drop is proportional to square of flow rate
+    pressure_drop = reference_pressure_drop * (air_flow_m3s / reference_flow) ** 2
+    
+    # Apply correction for number of rows
+    pressure_drop *= rows / 3.0
+    
+    # Apply correction for fin spacing
+    pressure_drop *= 2.0 / fin_spacing
+    
+    return pressure_drop
+
+
+# Scalar calls are memoized for solvers that retry the same flow; the
+# geometry is part of the key, so changing it needs no invalidation
+_water_pressure_drop_cached = lru_cache(maxsize=4096)(_water_pressure_drop)
+_air_pressure_drop_cached = lru_cache(maxsize=4096)(_air_pressure_drop)
+
+
+class HXResult(NamedTuple):
+    """
+    Result of HeatExchanger.calculate_heat_transfer.
+    
+    Fields can also be read by name as with the dictionary this replaces,
+    e.g. result["heat_transfer"]; use _asdict() for an actual dictionary.
+    """
+    heat_transfer: float      # Heat transfer rate in kW
+    effectiveness: float      # Heat exchanger effectiveness (0-1)
+    water_outlet_temp: float  # Water outlet temperature in °C
+    air_outlet_temp: float    # Air outlet temperature in °C
+    lmtd: float               # Log mean temperature difference in K
+    ua_value: float           # UA value in kW/K
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
 
 
 class HeatExchanger:
@@ -30,41 +132,40 @@ class HeatExchanger:
             air_temp_in (float): Air inlet temperature in °C
             
         Returns:
-            dict: Heat transfer results
+            HXResult: Heat transfer results
         """
-        # Convert units
-        water_flow_m3s = water_flow / 3600  # m³/s
-        air_flow_m3s = air_flow / 3600      # m³/s
-        
-        # Properties of fluids
-        water_density = 1000.0  # kg/m³
-        water_specific_heat = 4.18  # kJ/kg·K
-        air_density = 1.2  # kg/m³
-        air_specific_heat = 1.005  # kJ/kg·K
-        
-        # Calculate mass flow rates
-        water_mass_flow = water_flow_m3s * water_density  # kg/s
-        air_mass_flow = air_flow_m3s * air_density        # kg/s
-        
         # Calculate heat capacity rates
-        water_heat_capacity_rate = water_mass_flow * water_specific_heat  # kW/K
-        air_heat_capacity_rate = air_mass_flow * air_specific_heat        # kW/K
+        water_heat_capacity_rate = water_flow * _WATER_HEAT_CAPACITY_PER_M3H  # kW/K
+        air_heat_capacity_rate = air_flow * _AIR_HEAT_CAPACITY_PER_M3H        # kW/K
+        
+        # Reciprocals are taken once and reused for NTU, the capacity ratio
+        # and both outlet temperatures
+        inv_water_heat_capacity_rate = 1.0 / water_heat_capacity_rate
+        inv_air_heat_capacity_rate = 1.0 / air_heat_capacity_rate
         
         # Determine minimum and maximum heat capacity rates
-        c_min = min(water_heat_capacity_rate, air_heat_capacity_rate)
-        c_max = max(water_heat_capacity_rate, air_heat_capacity_rate)
+        if water_heat_capacity_rate < air_heat_capacity_rate:
+            c_min, inv_c_min, inv_c_max = (water_heat_capacity_rate, inv_water_heat_capacity_rate,
+                                           inv_air_heat_capacity_rate)
+        else:
+            c_min, inv_c_min, inv_c_max = (air_heat_capacity_rate, inv_air_heat_capacity_rate,
+                                           inv_water_heat_capacity_rate)
         
         # Calculate heat exchanger effectiveness
-        ntu = self.u_value * self.area / c_min
-        c_ratio = c_min / c_max
+        ntu = self.u_value * self.area * inv_c_min
+        c_ratio = c_min * inv_c_max
         
         # Use NTU method to calculate effectiveness for a cross-flow heat exchanger
+        # (1 - exp(x) is evaluated as -expm1(x) to keep precision for small x)
         if c_ratio < 0.01:  # One fluid with constant temperature (C_max -> infinity)
-            effectiveness = 1 - math.exp(-ntu)
+            effectiveness = -math.expm1(-ntu)
         else:
-            # Cross-flow with both fluids unmixed
-            effectiveness = 1 - math.exp(
-                (1 / c_ratio) * (ntu ** 0.22) * (math.exp(-c_ratio * (ntu ** 0.78)) - 1)
+            # Cross-flow with both fluids unmixed; ntu**0.22 is taken as
+            # ntu / ntu**0.78 so only one fractional power is evaluated
+            ntu_078 = ntu ** 0.78
+            ntu_022 = ntu / ntu_078 if ntu_078 else 0.0
+            effectiveness = -math.expm1(
+                (ntu_022 / c_ratio) * math.expm1(-c_ratio * ntu_078)
             )
         
         # Apply correction factors
@@ -77,20 +178,83 @@ class HeatExchanger:
         q_actual = effectiveness * q_max  # kW
         
         # Calculate outlet temperatures
-        water_temp_out = water_temp_in + q_actual / water_heat_capacity_rate
-        air_temp_out = air_temp_in - q_actual / air_heat_capacity_rate
+        water_temp_out = water_temp_in + q_actual * inv_water_heat_capacity_rate
+        air_temp_out = air_temp_in - q_actual * inv_air_heat_capacity_rate
         
         # Calculate log mean temperature difference (LMTD)
         delta_t1 = air_temp_in - water_temp_out
         delta_t2 = air_temp_out - water_temp_in
-        if abs(delta_t1 - delta_t2) < 0.1:
-            lmtd = delta_t1  # Avoid division by near-zero
+        # (log(dt1 / dt2) is evaluated as log1p((dt1 - dt2) / dt2), which stays
+        # accurate as the two differences approach each other)
+        if delta_t1 == delta_t2:
+            lmtd = delta_t1
         else:
-            lmtd = (delta_t1 - delta_t2) / math.log(delta_t1 / delta_t2)
+            lmtd = (delta_t1 - delta_t2) / math.log1p((delta_t1 - delta_t2) / delta_t2)
         
         # Calculate UA value (overall heat transfer coefficient times area)
         ua_value = q_actual / lmtd
         
+        return HXResult(q_actual, effectiveness, water_temp_out, air_temp_out, lmtd, ua_value)
+    
+    def calculate_heat_transfer_array(self, water_flow, water_temp_in, air_flow, air_temp_in):
+        """
+        Calculate heat transfer for arrays of operating points
+        
+        Vectorized form of calculate_heat_transfer; the inputs are broadcast
+        against each other. Points where the scalar method would divide by
+        zero yield inf or nan instead of raising.
+        
+        Args:
+            water_flow (array-like): Water flow rate in m³/h
+            water_temp_in (array-like): Water inlet temperature in °C
+            air_flow (array-like): Air flow rate in m³/h
+            air_temp_in (array-like): Air inlet temperature in °C
+            
+        Returns:
+            dict: Heat transfer results, each an array over the operating points
+        """
+        water_temp_in = np.asarray(water_temp_in, dtype=float)
+        air_temp_in = np.asarray(air_temp_in, dtype=float)
+        
+        # Calculate heat capacity rates
+        water_heat_capacity_rate = np.asarray(water_flow, dtype=float) * _WATER_HEAT_CAPACITY_PER_M3H
+        air_heat_capacity_rate = np.asarray(air_flow, dtype=float) * _AIR_HEAT_CAPACITY_PER_M3H
+        
+        c_min = np.minimum(water_heat_capacity_rate, air_heat_capacity_rate)
+        c_max = np.maximum(water_heat_capacity_rate, air_heat_capacity_rate)
+        
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            ntu = self.u_value * self.area / c_min
+            c_ratio = c_min / c_max
+            
+            # Effectiveness for cross-flow with both fluids unmixed, or with
+            # one fluid at constant temperature when c_ratio is small
+            ntu_078 = ntu ** 0.78
+            ntu_022 = np.where(ntu_078 > 0, ntu / ntu_078, 0.0)
+            effectiveness = np.where(
+                c_ratio < 0.01,
+                -np.expm1(-ntu),
+                -np.expm1((ntu_022 / c_ratio) * np.expm1(-c_ratio * ntu_078))
+            )
+            effectiveness *= self.effectiveness / 0.7
+            
+            q_actual = effectiveness * c_min * (air_temp_in - water_temp_in)
+            
+            water_temp_out = water_temp_in + q_actual / water_heat_capacity_rate
+            air_temp_out = air_temp_in - q_actual / air_heat_capacity_rate
+            
+            # Log mean temperature difference
+            delta_t1 = air_temp_in - water_temp_out
+            delta_t2 = air_temp_out - water_temp_in
+            delta_t_difference = delta_t1 - delta_t2
+            lmtd = np.where(
+                delta_t_difference == 0,
+                delta_t1,
+                delta_t_difference / np.log1p(delta_t_difference / delta_t2)
+            )
+            
+            ua_value = q_actual / lmtd
+        
         return {
             "heat_transfer": q_actual,
             "effectiveness": effectiveness,
@@ -105,56 +269,52 @@ class HeatExchanger:
         Calculate water-side pressure drop through the heat exchanger
         
         Args:
-            water_flow (float): Water flow rate in m³/h
+            water_flow (float or numpy.ndarray): Water flow rate in m³/h
             
         Returns:
-            float: Pressure drop in kPa
+            float or numpy.ndarray: Pressure drop in kPa
         """
-        # Converting to SI units
-        water_flow_m3s = water_flow / 3600  # m³/s
-        
-        # Reference conditions
-        reference_flow = 2.0 / 3600  # m³/s (2.0 m³/h)
-        reference_pressure_drop = 20.0  # kPa
-        
-        # Pressure drop is proportional to square of flow rate
-        pressure_drop = reference_pressure_drop * (water_flow_m3s / reference_flow) ** 2
-        
-        # Apply correction for number of rows (more rows = more pressure drop)
-        pressure_drop *= self.rows / 3.0
-        
-        # Apply correction for fin spacing (smaller spacing = more pressure drop)
-        pressure_drop *= 2.0 / self.fin_spacing
+        return self.calculate_pressure_drop_si(water_flow * _INV_3600)
+    
+    def calculate_pressure_drop_si(self, water_flow_m3s):
+        """
+        Calculate water-side pressure drop for a flow rate already in m³/s
         
-        return pressure_drop
+        Args:
+            water_flow_m3s (float or numpy.ndarray): Water flow rate in m³/s
+            
+        Returns:
+            float or numpy.ndarray: Pressure drop in kPa
+        """
+        if isinstance(water_flow_m3s, np.ndarray):
+            return _water_pressure_drop(water_flow_m3s, self.rows, self.fin_spacing)
+        return _water_pressure_drop_cached(water_flow_m3s, self.rows, self.fin_spacing)
     
     def calculate_air_pressure_drop(self, air_flow):
         """
         Calculate air-side pressure drop through the heat exchanger
         
         Args:
-            air_flow (float): Air flow rate in m³/h
+            air_flow (float or numpy.ndarray): Air flow rate in m³/h
             
         Returns:
-            float: Pressure drop in Pa
+            float or numpy.ndarray: Pressure drop in Pa
         """
-        # Converting to SI units
-        air_flow_m3s = air_flow / 3600  # m³/s
-        
-        # Reference conditions
-        reference_flow = 5000.0 / 3600  # m³/s (5000 m³/h)
-        reference_pressure_drop = 50.0  # Pa
-        
-        # Pressure drop is proportional to square of flow rate
-        pressure_drop = reference_pressure_drop * (air_flow_m3s / reference_flow) ** 2
-        
-        # Apply correction for number of rows
-        pressure_drop *= self.rows / 3.0
-        
-        # Apply correction for fin spacing
-        pressure_drop *= 2.0 / self.fin_spacing
+        return self.calculate_air_pressure_drop_si(air_flow * _INV_3600)
+    
+    def calculate_air_pressure_drop_si(self, air_flow_m3s):
+        """
+        Calculate air-side pressure drop for a flow rate already in m³/s
         
-        return pressure_drop
+        Args:
+            air_flow_m3s (float or numpy.ndarray): Air flow rate in m³/s
+            
+        Returns:
+            float or numpy.ndarray: Pressure drop in Pa
+        """
+        if isinstance(air_flow_m3s, np.ndarray):
+            return _air_pressure_drop(air_flow_m3s, self.rows, self.fin_spacing)
+        return _air_pressure_drop_cached(air_flow_m3s, self.rows, self.fin_spacing)
     
     def set_geometry(self, area=None, rows=None, fin_spacing=None):
         """
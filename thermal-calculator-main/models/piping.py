@@ -3,6 +3,193 @@ Piping model for the Data Center Cooling Calculator.
 """
 
 import math
+from functools import lru_cache
+
+import numpy as np
+
+# Converts flow rates from m³/h to m³/s
+_INV_3600 = 1.0 / 3600
+
+# Constants of the two-point Colebrook approximation, evaluated at friction
+# factors of 0.02 and 0.018
+_C1 = math.sqrt(0.02)
+_C2 = math.sqrt(0.018)
+_INV_C1 = 1.0 / _C1
+_DF = 0.02 - 0.018
+
+
+def _darcy_pressure_drop(flow_rate_m3s, diameter_m, roughness_m, pipe_length, eq_length,
+                         density, viscosity):
+    """
+    Calculate the Darcy-Weisbach pressure drop of pipe flow
+    
+    Numeric core of Piping.calculate_pressure_drop, working only on floats.
+    
+    Args:
+        flow_rate_m3s (float): Flow rate in m³/s
+        diameter_m (float): Pipe internal diameter in m
+        roughness_m (float): Pipe roughness in m
+        pipe_length (float): Straight pipe length in m
+        eq_length (float): Equivalent length of fittings in m
+        density (float): Fluid density in kg/m³
+        viscosity (float): Fluid dynamic viscosity in Pa·s
+        
+    Returns:
+        float: Pressure drop in Pa
+    """
+    # Calculate flow velocity
+    area = math.pi * (diameter_m ** 2) / 4  # m²
+    velocity = flow_rate_m3s / area  # m/s
+    
+    # Calculate Reynolds number
+    reynolds = density * velocity * diameter_m / viscosity
+    
+    # Calculate friction factor using Colebrook equation
+    relative_roughness = roughness_m / diameter_m
+    
+    # Blend the laminar and turbulent friction factors with a weight that is
+    # 0 below Re 2000, 1 above Re 4000 and linear in between. Clamping the
+    # Reynolds number of each regime to its boundary reproduces the
+    # transitional interpolation between 64/2000 and the turbulent value at
+    # Re 4000 without branching on the flow regime.
+    laminar_factor = 64 / min(reynolds, 2000)
+    
+    # Turbulent flow - use approximation of Colebrook equation
+    k = relative_roughness / 3.7
+    inv_re = 2.51 / max(reynolds, 4000)
+    a = -2 * math.log10(k + inv_re / _C1)
+    b = -2 * math.log10(k + inv_re / _C2)
+    turbulent_factor = _DF / (a - b) * (a - _INV_C1) + 0.02
+    
+    t = min(max((reynolds - 2000) / 2000, 0.0), 1.0)
+    friction_factor = laminar_factor * (1 - t) + turbulent_factor * t
+    
+    # Darcy-Weisbach equation over the straight pipe and the fittings'
+    # equivalent length: ΔP = f * (L/D) * (ρv²/2)
+    return (friction_factor * (pipe_length + eq_length) / diameter_m *
+            density * (velocity ** 2) / 2)
+
+
+def _darcy_pressure_drop_array(flow_rate_m3s, diameter_m, roughness_m, pipe_length, eq_length,
+                               density, viscosity):
+    """
+    Calculate Darcy-Weisbach pressure drops for arrays of flow states
+    
+    Vectorized form of _darcy_pressure_drop; the flow and fluid arrays are
+    broadcast against each other. Zero flow gives zero pressure drop.
+    
+    Args:
+        flow_rate_m3s (numpy.ndarray): Flow rate in m³/s
+        diameter_m (float): Pipe internal diameter in m
+        roughness_m (float): Pipe roughness in m
+        pipe_length (float): Straight pipe length in m
+        eq_length (float): Equivalent length of fittings in m
+        density (numpy.ndarray): Fluid density in kg/m³
+        viscosity (numpy.ndarray): Fluid dynamic viscosity in Pa·s
+        
+    Returns:
+        numpy.ndarray: Pressure drop in Pa
+    """
+    area = math.pi * (diameter_m ** 2) / 4  # m²
+    velocity = flow_rate_m3s / area  # m/s
+    reynolds = density * velocity * diameter_m / viscosity
+    
+    # Same regime blend as the scalar core; the laminar term only matters
+    # below Re 4000, so flooring it at Re 1 just keeps zero flow finite
+    laminar_factor = 64 / np.clip(reynolds, 1.0, 2000.0)
+    
+    k = roughness_m / diameter_m / 3.7
+    inv_re = 2.51 / np.maximum(reynolds, 4000.0)
+    a = -2 * np.log10(k + inv_re / _C1)
+    b = -2 * np.log10(k + inv_re / _C2)
+    turbulent_factor = _DF / (a - b) * (a - _INV_C1) + 0.02
+    
+    t = np.clip((reynolds - 2000) / 2000, 0.0, 1.0)
+    friction_factor = laminar_factor * (1 - t) + turbulent_factor * t
+    
+    return (friction_factor * (pipe_length + eq_length) / diameter_m *
+            density * velocity * velocity * 0.5)
+
+
+# Mixture coefficients per fluid: (density increase per % glycol in kg/m³,
+# viscosity increase per % glycol, extra viscosity temperature exponent in 1/°C)
+_FLUID_TABLE = {
+    "water": (0.0, 0.0, 0.0),
+    "propylene_glycol": (1.5, 0.1, -0.03),
+    "ethylene_glycol": (1.8, 0.08, -0.025),
+}
+
+
+@lru_cache(maxsize=512)
+def _fluid_properties(fluid_type, temperature, glycol_percentage):
+    """
+    Get fluid density and viscosity, cached for repeated fluid states
+    
+    Args:
+        fluid_type (str): Type of fluid
+        temperature (float): Fluid temperature in °C
+        glycol_percentage (int): Percentage of glycol in mixture
+        
+    Returns:
+        tuple: (density in kg/m³, viscosity in Pa·s)
+    """
+    coefficients = _FLUID_TABLE.get(fluid_type)
+    if coefficients is None:
+        # Default to water properties
+        return 1000, 0.001  # kg/m³, Pa·s
+    
+    density_glycol_coef, viscosity_glycol_coef, viscosity_temp_coef = coefficients
+    
+    # Approximate mixture properties as a function of temperature
+    base_density = 1000 - 0.1 * (temperature - 20)  # kg/m³
+    density = base_density + glycol_percentage * density_glycol_coef
+    
+    base_viscosity = 0.001 * math.exp(-0.02 * (temperature - 20))  # Pa·s
+    glycol_factor = 1 + viscosity_glycol_coef * glycol_percentage  # viscosity increases with glycol percentage
+    # Glycol viscosity decreases further with temperature
+    temp_factor = math.exp(viscosity_temp_coef * temperature) if viscosity_temp_coef else 1.0
+    viscosity = base_viscosity * glycol_factor * temp_factor
+    
+    return density, viscosity
+
+
+@lru_cache(maxsize=128)
+def _insulation_resistance(pipe_diameter, insulation_thickness):
+    """
+    Get the thermal resistance per unit length of insulated pipe
+    
+    Depends only on geometry, so it is cached for sweeps over fluid and
+    ambient temperatures.
+    
+    Args:
+        pipe_diameter (float): Pipe internal diameter in mm
+        insulation_thickness (float): Insulation thickness in mm
+        
+    Returns:
+        float: Total thermal resistance per unit length in m·K/W
+    """
+    # Convert to meters
+    diameter_m = pipe_diameter / 1000
+    insulation_thickness_m = insulation_thickness / 1000
+    
+    # Thermal conductivity of insulation (typical value for pipe insulation)
+    k_insulation = 0.04  # W/(m·K)
+    
+    # Heat transfer coefficient for outer surface to air
+    h_outer = 10  # W/(m²·K)
+    
+    # Calculate thermal resistance
+    r1 = diameter_m / 2
+    r2 = r1 + insulation_thickness_m
+    
+    # Thermal resistance of insulation
+    r_insulation = math.log(r2/r1) / (2 * math.pi * k_insulation)
+    
+    # Thermal resistance of outer surface
+    r_surface = 1 / (2 * math.pi * r2 * h_outer)
+    
+    # Total thermal resistance per unit length
+    return r_insulation + r_surface
 
 
 class Piping:
@@ -22,6 +209,10 @@ class Piping:
             "tees": 2,             # Number of tees
             "valves": 2            # Number of valves
         }
+        self.insulation_thickness = 20.0  # Insulation thickness in mm
+        
+        # Equivalent length of the fittings, updated by set_piping_specs
+        self._eq_length = self._compute_equivalent_length()
         
     def calculate_pressure_drop(self, flow_rate, fluid_type="water", temperature=20, 
                                 glycol_percentage=0):
@@ -34,59 +225,81 @@ class Piping:
             temperature (float): Fluid temperature in °C
             glycol_percentage (int): Percentage of glycol in mixture
             
+        Returns:
+            float: Pressure drop in kPa
+        """
+        return self.calculate_pressure_drop_si(flow_rate * _INV_3600, fluid_type, temperature,
+                                               glycol_percentage)
+    
+    def calculate_pressure_drop_si(self, flow_rate_m3s, fluid_type="water", temperature=20,
+                                   glycol_percentage=0):
+        """
+        Calculate pressure drop through the piping system for a flow rate in m³/s
+        
+        Args:
+            flow_rate_m3s (float): Water flow rate in m³/s
+            fluid_type (str): Type of fluid (water, propylene_glycol, ethylene_glycol)
+            temperature (float): Fluid temperature in °C
+            glycol_percentage (int): Percentage of glycol in mixture
+            
         Returns:
             float: Pressure drop in kPa
         """
         # Convert units
-        flow_rate_m3s = flow_rate / 3600  # m³/s
         diameter_m = self.pipe_diameter / 1000  # m
         
         # Get fluid properties
         density, viscosity = self.get_fluid_properties(fluid_type, temperature, glycol_percentage)
         
-        # Calculate flow velocity
-        area = math.pi * (diameter_m ** 2) / 4  # m²
-        velocity = flow_rate_m3s / area  # m/s
-        
-        # Calculate Reynolds number
-        reynolds = density * velocity * diameter_m / viscosity
-        
-        # Calculate friction factor using Colebrook equation
-        relative_roughness = (self.roughness / 1000) / diameter_m
-        
-        if reynolds < 2000:
-            # Laminar flow
-            friction_factor = 64 / reynolds
-        elif reynolds > 4000:
-            # Turbulent flow - use approximation of Colebrook equation
-            a = -2 * math.log10(relative_roughness / 3.7 + 2.51 / (reynolds * math.sqrt(0.02)))
-            b = -2 * math.log10(relative_roughness / 3.7 + 2.51 / (reynolds * math.sqrt(0.018)))
-            friction_factor = (0.02 - 0.018) / (a - b) * (a - 1/math.sqrt(0.02)) + 0.02
-        else:
-            # Transitional flow - interpolate
-            laminar_factor = 64 / 2000
-            a = -2 * math.log10(relative_roughness / 3.7 + 2.51 / (4000 * math.sqrt(0.02)))
-            b = -2 * math.log10(relative_roughness / 3.7 + 2.51 / (4000 * math.sqrt(0.018)))
-            turbulent_factor = (0.02 - 0.018) / (a - b) * (a - 1/math.sqrt(0.02)) + 0.02
-            
-            # Linear interpolation
-            t = (reynolds - 2000) / 2000
-            friction_factor = laminar_factor * (1 - t) + turbulent_factor * t
-        
-        # Calculate straight pipe pressure drop using Darcy-Weisbach equation
-        # ΔP = f * (L/D) * (ρv²/2)
-        straight_pressure_drop = (friction_factor * self.pipe_length / diameter_m * 
-                                 density * (velocity ** 2) / 2)
-        
         # Calculate equivalent length of fittings
         eq_length = self.calculate_equivalent_length()
         
-        # Calculate fitting pressure drop
-        fitting_pressure_drop = (friction_factor * eq_length / diameter_m * 
-                                density * (velocity ** 2) / 2)
-        
         # Total pressure drop in Pa
-        total_pressure_drop = straight_pressure_drop + fitting_pressure_drop
+        total_pressure_drop = _darcy_pressure_drop(
+            flow_rate_m3s, diameter_m, self.roughness / 1000, self.pipe_length, eq_length,
+            density, viscosity
+        )
+        
+        # Convert to kPa
+        return total_pressure_drop / 1000
+    
+    def calculate_pressure_drop_array(self, flow_rate, fluid_type="water", temperature=20,
+                                      glycol_percentage=0):
+        """
+        Calculate pressure drops through the piping system for arrays of flows
+        
+        Vectorized form of calculate_pressure_drop; flow rate, temperature and
+        glycol percentage are broadcast against each other.
+        
+        Args:
+            flow_rate (array-like): Water flow rate in m³/h
+            fluid_type (str): Type of fluid (water, propylene_glycol, ethylene_glycol)
+            temperature (array-like): Fluid temperature in °C
+            glycol_percentage (array-like): Percentage of glycol in mixture
+            
+        Returns:
+            numpy.ndarray: Pressure drop in kPa
+        """
+        flow_rate_m3s = np.asarray(flow_rate, dtype=float) * _INV_3600  # m³/s
+        
+        temperature, glycol_percentage = np.broadcast_arrays(
+            np.asarray(temperature, dtype=float), np.asarray(glycol_percentage, dtype=float)
+        )
+        
+        # Fluid properties are evaluated once per distinct (temperature, glycol) state
+        states, inverse = np.unique(
+            np.stack((temperature.ravel(), glycol_percentage.ravel()), axis=-1),
+            axis=0, return_inverse=True
+        )
+        properties = np.array(
+            [_fluid_properties(fluid_type, t, g) for t, g in states.tolist()], dtype=float
+        )
+        density, viscosity = properties[inverse.ravel()].T.reshape((2,) + temperature.shape)
+        
+        total_pressure_drop = _darcy_pressure_drop_array(
+            flow_rate_m3s, self.pipe_diameter / 1000, self.roughness / 1000,
+            self.pipe_length, self._eq_length, density, viscosity
+        )
         
         # Convert to kPa
         return total_pressure_drop / 1000
@@ -103,36 +316,18 @@ class Piping:
         Returns:
             tuple: (density in kg/m³, viscosity in Pa·s)
         """
-        if fluid_type == "water":
-            # Approximate water properties as a function of temperature
-            density = 1000 - 0.1 * (temperature - 20)  # kg/m³
-            viscosity = 0.001 * math.exp(-0.02 * (temperature - 20))  # Pa·s
-        elif fluid_type == "propylene_glycol":
-            # Approximate propylene glycol mixture properties
-            base_density = 1000 - 0.1 * (temperature - 20)  # kg/m³
-            density = base_density + glycol_percentage * 1.5
-            
-            base_viscosity = 0.001 * math.exp(-0.02 * (temperature - 20))  # Pa·s
-            glycol_factor = 1 + 0.1 * glycol_percentage  # viscosity increases with glycol percentage
-            temp_factor = math.exp(-0.03 * temperature)  # viscosity decreases with temperature
-            viscosity = base_viscosity * glycol_factor * temp_factor
-        elif fluid_type == "ethylene_glycol":
-            # Approximate ethylene glycol mixture properties
-            base_density = 1000 - 0.1 * (temperature - 20)  # kg/m³
-            density = base_density + glycol_percentage * 1.8
-            
-            base_viscosity = 0.001 * math.exp(-0.02 * (temperature - 20))  # Pa·s
-            glycol_factor = 1 + 0.08 * glycol_percentage  # viscosity increases with glycol percentage
-            temp_factor = math.exp(-0.025 * temperature)  # viscosity decreases with temperature
-            viscosity = base_viscosity * glycol_factor * temp_factor
-        else:
-            # Default to water properties
-            density = 1000  # kg/m³
-            viscosity = 0.001  # Pa·s
-        
-        return density, viscosity
+        return _fluid_properties(fluid_type, temperature, glycol_percentage)
     
     def calculate_equivalent_length(self):
+        """
+        Get the equivalent length of all fittings
+        
+        Returns:
+            float: Equivalent length in m
+        """
+        return self._eq_length
+    
+    def _compute_equivalent_length(self):
         """
         Calculate equivalent length of all fittings
         
@@ -152,43 +347,24 @@ class Piping:
         
         return eq_length
     
-    def calculate_heat_loss(self, fluid_temp, ambient_temp, insulation_thickness=20):
+    def calculate_heat_loss(self, fluid_temp, ambient_temp, insulation_thickness=None):
         """
         Calculate heat loss through piping
         
         Args:
             fluid_temp (float): Fluid temperature in °C
             ambient_temp (float): Ambient temperature in °C
-            insulation_thickness (float): Insulation thickness in mm
+            insulation_thickness (float, optional): Insulation thickness in mm,
+                defaults to the thickness set with set_piping_specs
             
         Returns:
             float: Heat loss in kW
         """
-        # Convert to meters
-        diameter_m = self.pipe_diameter / 1000
-        insulation_thickness_m = insulation_thickness / 1000
-        
-        # Thermal conductivity of insulation (typical value for pipe insulation)
-        k_insulation = 0.04  # W/(m·K)
-        
-        # Heat transfer coefficient for outer surface to air
-        h_outer = 10  # W/(m²·K)
-        
-        # Outer diameter of insulated pipe
-        outer_diameter = diameter_m + 2 * insulation_thickness_m
-        
-        # Calculate thermal resistance
-        r1 = diameter_m / 2
-        r2 = r1 + insulation_thickness_m
-        
-        # Thermal resistance of insulation
-        r_insulation = math.log(r2/r1) / (2 * math.pi * k_insulation)
-        
-        # Thermal resistance of outer surface
-        r_surface = 1 / (2 * math.pi * r2 * h_outer)
+        if insulation_thickness is None:
+            insulation_thickness = self.insulation_thickness
         
         # Total thermal resistance per unit length
-        r_total = r_insulation + r_surface
+        r_total = _insulation_resistance(self.pipe_diameter, insulation_thickness)
         
         # Heat loss per unit length
         q_per_length = (fluid_temp - ambient_temp) / r_total  # W/m
@@ -202,7 +378,8 @@ class Piping:
         return q_total_kw
     
     def set_piping_specs(self, pipe_diameter=None, pipe_length=None, 
-                         pipe_material=None, roughness=None, fittings=None):
+                         pipe_material=None, roughness=None, fittings=None,
+                         insulation_thickness=None):
         """
         Set piping specifications
         
@@ -212,6 +389,7 @@ class Piping:
             pipe_material (str, optional): Pipe material
             roughness (float, optional): Pipe roughness in mm
             fittings (dict, optional): Dictionary of fittings counts
+            insulation_thickness (float, optional): Insulation thickness in mm
         """
         if pipe_diameter is not None:
             self.pipe_diameter = pipe_diameter
@@ -230,4 +408,10 @@ class Piping:
         if roughness is not None:
             self.roughness = roughness
         if fittings is not None:
-            self.fittings.update(fittings) 
\ No newline at end of file
+            self.fittings.update(fittings)
+        if insulation_thickness is not None:
+            self.insulation_thickness = insulation_thickness
+        
+        # Fittings scale with the pipe diameter
+        if pipe_diameter is not None or fittings is not None:
+            self._eq_length = self._compute_equivalent_length() 
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""
+Batch evaluation of cooling system components for the Data Center Cooling Calculator.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+class SystemArrays(NamedTuple):
+    """
+    Operating points of a parameter sweep, one array per parameter.
+
+    The fields are broadcast against each other, so any of them can be a
+    scalar held constant over the sweep.
+    """
+    water_flow: np.ndarray  # Water flow rate in m³/h
+    water_temp_in: np.ndarray  # Water inlet temperature in °C
+    air_flow: np.ndarray  # Air flow rate in m³/h
+    air_temp_in: np.ndarray  # Air inlet temperature in °C
+    fan_speed: np.ndarray = 100.0  # Fan speed as percentage of maximum (0-100)
+    glycol_percentage: np.ndarray = 0.0  # Percentage of glycol in mixture
+
+
+def evaluate_system(arrays, fan, hx, piping, fluid_type="water"):
+    """
+    Evaluate fan, heat exchanger and piping models over a whole sweep
+
+    Dispatches to the vectorized methods of each model, so a sweep is one
+    call instead of a Python loop over scenarios.
+
+    Args:
+        arrays (SystemArrays): Operating points
+        fan (Fan): Fan model
+        hx (HeatExchanger): Heat exchanger model
+        piping (Piping): Piping model
+        fluid_type (str): Type of fluid (water, propylene_glycol, ethylene_glycol)
+
+    Returns:
+        dict: Arrays of heat transfer results (see
+        HeatExchanger.calculate_heat_transfer), pressure drops and fan
+        performance, all of the broadcast sweep shape
+    """
+    water_flow, water_temp_in, air_flow, air_temp_in, fan_speed, glycol_percentage = (
+        np.broadcast_arrays(*(np.asarray(field, dtype=float) for field in arrays))
+    )
+
+    results = hx.calculate_heat_transfer_array(water_flow, water_temp_in, air_flow, air_temp_in)
+
+    # Pressure drops: the coil on both sides, and the piping at the water inlet temperature
+    coil_air_pressure_drop = hx.calculate_air_pressure_drop(air_flow)  # Pa
+    coil_water_pressure_drop = hx.calculate_pressure_drop(water_flow)  # kPa
+    piping_pressure_drop = piping.calculate_pressure_drop_array(
+        water_flow, fluid_type, water_temp_in, glycol_percentage
+    )  # kPa
+
+    # Fan operating against the coil's air-side pressure drop
+    results["coil_air_pressure_drop"] = coil_air_pressure_drop
+    results["coil_water_pressure_drop"] = coil_water_pressure_drop
+    results["piping_pressure_drop"] = piping_pressure_drop
+    results["water_pressure_drop"] = coil_water_pressure_drop + piping_pressure_drop
+    results["fan_flow_capacity"] = fan.calculate_flow_at_pressure_array(coil_air_pressure_drop, fan_speed)
+    results["fan_power"] = fan.calculate_power_array(air_flow, coil_air_pressure_drop, fan_speed)
+
+    return results
@@ -31,7 +31,6 @@ setup(
     install_requires=[
         "flask>=2.0.0",
         "numpy>=1.20.0",
-        "pandas>=1.3.0",
         "matplotlib>=3.4.0",
         "pyyaml>=6.0",
         "requests>=2.26.0",
@@ -39,6 +38,10 @@ setup(
         "reportlab>=3.6.0",
         "pytest>=6.2.5",
     ],
+    extras_require={
+        # Only the validation framework reads test data through pandas
+        "validation": ["pandas>=1.3.0"],
+    },
     entry_points={
         "console_scripts": [
             "cooling-calculator=main:main",
@@ -0,0 +1,52 @@
+"""
+Tests for the rear door heat exchanger calculator of the thermosiphon GUI.
+"""
+
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip("tkinter")
+pytest.importorskip("matplotlib")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "thermo siphon archive"))
+
+from thermal_calculator_gui import RearDoorCalculator  # noqa: E402
+
+
+def _balanced_params():
+    params = RearDoorCalculator().params.copy()
+    # Both end temperature differences are 10 K
+    params.update(inlet_water_temp=18.0, outlet_water_temp=28.0,
+                  inlet_air_temp=38.0, outlet_air_temp=28.0)
+    return params
+
+
+def test_balanced_flow_uses_end_difference_as_lmtd():
+    params = _balanced_params()
+    results = RearDoorCalculator(params).calculate()
+    
+    door_area = params["door_width"] * params["door_height"]
+    expected = results["water_heat_capacity"] * 1000 / (door_area * 10.0)
+    assert results["heat_transfer_coefficient"] == pytest.approx(expected)
+
+
+def test_balanced_flow_batch_matches_scalar():
+    params = _balanced_params()
+    calculator = RearDoorCalculator(params)
+    
+    batch = calculator.calculate_batch({"door_width": np.full(2, params["door_width"])})
+    np.testing.assert_allclose(batch["heat_transfer_coefficient"],
+                               calculator.calculate()["heat_transfer_coefficient"])
+
+
+def test_crossed_temperatures_give_nan_coefficient():
+    params = RearDoorCalculator().params.copy()
+    params["outlet_air_temp"] = 10.0
+    
+    results = RearDoorCalculator(params).calculate()
+    assert math.isnan(results["heat_transfer_coefficient"])
+    assert results["water_heat_capacity"] > 0
@@ -0,0 +1,31 @@
+"""
+Tests for loading the databases with schema validation.
+"""
+
+import json
+
+import pytest
+
+from database.schema import (DatabaseManager, SAMPLE_FLUID_PROPERTIES, SAMPLE_PRODUCT_DATABASE,
+                             SAMPLE_REGIONAL_SETTINGS, thaw)
+
+
+def _write_sample_databases(data_dir):
+    for filename, data in (("products.json", SAMPLE_PRODUCT_DATABASE),
+                           ("regional_settings.json", SAMPLE_REGIONAL_SETTINGS),
+                           ("fluid_properties.json", SAMPLE_FLUID_PROPERTIES)):
+        with open(data_dir / filename, "w") as f:
+            json.dump(thaw(data), f)
+
+
+@pytest.mark.parametrize("strict_validation", [False, True])
+def test_load_databases_with_jsonschema(tmp_path, strict_validation):
+    jsonschema = pytest.importorskip("jsonschema")
+    _write_sample_databases(tmp_path)
+    
+    manager = DatabaseManager(str(tmp_path))
+    manager.validator = jsonschema
+    manager.strict_validation = strict_validation
+    
+    assert manager.load_databases()
+    assert len(manager.products) == len(SAMPLE_PRODUCT_DATABASE)
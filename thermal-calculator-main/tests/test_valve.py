@@ -0,0 +1,49 @@
+"""
+Tests for the valve model.
+"""
+
+import math
+
+import numpy as np
+
+from models.valve import Valve, pressure_drop_soa, valves_to_array
+
+
+def _closed_valve():
+    valve = Valve()
+    valve.set_valve_specs(valve_type="ball", opening=0)
+    return valve
+
+
+def test_closed_valve_without_flow_has_no_pressure_drop():
+    valve = _closed_valve()
+    
+    assert valve.calculate_pressure_drop(0) == 0.0
+    assert valve.calculate_pressure_drop(1.0) == math.inf
+
+
+def test_closed_valve_array_paths_match_scalar():
+    valve = _closed_valve()
+    flow_rate = np.array([0.0, 1.0])
+    
+    np.testing.assert_array_equal(valve.calculate_pressure_drop_array(flow_rate), [0.0, math.inf])
+    np.testing.assert_array_equal(
+        pressure_drop_soa(valves_to_array([valve, valve]), flow_rate), [0.0, math.inf]
+    )
+
+
+def test_direct_attribute_changes_take_effect():
+    valve = Valve()
+    reference = Valve()
+    
+    valve.opening = 50
+    reference.set_valve_specs(opening=50)
+    assert valve.calculate_pressure_drop(2.0) == reference.calculate_pressure_drop(2.0)
+    
+    valve.kv = 10.0
+    reference.set_valve_specs(kv=10.0)
+    assert valve.calculate_flow_rate(30.0) == reference.calculate_flow_rate(30.0)
+    
+    valve.valve_type = "ball"
+    reference.set_valve_specs(valve_type="ball")
+    np.testing.assert_array_equal(valve.system_curve([1.0, 2.0]), reference.system_curve([1.0, 2.0]))
@@ -1,12 +1,20 @@
 import math
 import numpy as np
-import matplotlib.pyplot as plt
-from dataclasses import dataclass
+from collections import namedtuple
+from dataclasses import asdict, astuple, dataclass, replace
+
+
+# Input parameters that the precomputed geometry depends on
+_GEOMETRY_FIELDS = frozenset(("height", "cold_pipe_diameter", "hot_pipe_diameter", "heat_pipe_diameter"))
 
 
 @dataclass
 class InputParameters:
-    """Input parameters for thermal calculations."""
+    """Input parameters for thermal calculations.
+    
+    Geometry derived from the inputs (pipe areas, pipe length and heat pipe
+    diameter in m) is precomputed once and kept in sync on assignment.
+    """
     heat_load: float = 100.0  # kW - Total heat output from servers
     ambient_temp: float = 25.0  # °C - Ambient temperature
     height: float = 10.0  # m - Height of thermosiphon system
@@ -19,11 +27,124 @@ class InputParameters:
     pcm_volume: float = 0.5  # m³ - Phase change material volume
     ahu_surface_area: float = 40.0  # m² - AHU surface area
     dimple_density: float = 1000.0  # dimples/m² - Dimples per square meter
+    
+    def __post_init__(self):
+        self._update_geometry()
+        
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Geometry is first computed in __post_init__, once every field is set
+        if name in _GEOMETRY_FIELDS and "pipe_length" in self.__dict__:
+            self._update_geometry()
+            
+    def _update_geometry(self):
+        """Precompute geometry derived from the input parameters."""
+        self.cold_pipe_area = math.pi * (self.cold_pipe_diameter/2)**2  # m²
+        self.hot_pipe_area = math.pi * (self.hot_pipe_diameter/2)**2  # m²
+        self.heat_pipe_diameter_m = self.heat_pipe_diameter / 1000  # m
+        self.pipe_length = self.height * 2.5  # m - Total pipe length
+
+
+def _thermosiphon_kernel(temp_diff, height, cold_pipe_area, pipe_length, heat_load,
+                         water_density, specific_heat, thermal_expansion, gravity,
+                         friction_factor, minor_loss):
+    """Thermosiphon flow and capacity on plain floats.
+    
+    Kept free of Python objects so batch callers can drive it directly.
+    Returns (density_change, driving_pressure, flow_rate, volumetric_flow,
+    flow_velocity, heat_capacity, system_efficiency).
+    """
+    sqrt = math.sqrt
+    
+    # Thermosiphon calculations
+    density_change = water_density * thermal_expansion * temp_diff  # kg/m³
+    driving_pressure = density_change * gravity * height  # Pa
+    
+    # Flow rate calculation: A·√(2·ΔP·ρ / (f·L + K))
+    flow_rate = cold_pipe_area * sqrt(
+        2 * driving_pressure * water_density / (friction_factor * pipe_length + minor_loss)
+    )  # kg/s
+    
+    volumetric_flow = flow_rate / water_density * 1000  # L/s
+    flow_velocity = volumetric_flow / (1000 * cold_pipe_area)  # m/s
+    
+    # Heat transfer capacity
+    heat_capacity = flow_rate * specific_heat * temp_diff / 1000  # kW
+    system_efficiency = heat_capacity / heat_load * 100  # %
+    if system_efficiency > 100:
+        system_efficiency = 100
+    
+    return (density_change, driving_pressure, flow_rate, volumetric_flow,
+            flow_velocity, heat_capacity, system_efficiency)
+
+
+class _ResultRecord:
+    """Dictionary-style read access for the calculator result tuples.
+    
+    Results can be read as attributes (results.heat_capacity) or by key as
+    with the dictionaries they replace (results["heat_capacity"]).
+    """
+    __slots__ = ()
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+        
+    def keys(self):
+        return self._fields
+        
+    def values(self):
+        return tuple(self)
+        
+    def items(self):
+        return zip(self._fields, self)
+
+
+class ThermoResult(_ResultRecord, namedtuple("ThermoResult", [
+        "temp_diff", "density_change", "driving_pressure", "flow_rate",
+        "volumetric_flow", "flow_velocity", "heat_capacity", "system_efficiency"])):
+    """Result of ThermosiphonCalculator.calculate."""
+    __slots__ = ()
+
+
+class HeatPipeResult(_ResultRecord, namedtuple("HeatPipeResult", [
+        "heat_pipe_capacity", "total_capacity", "stage1_capacity", "stage2_capacity",
+        "effective_conductivity", "copper_ratio", "system_efficiency"])):
+    """Result of HeatPipeCalculator.calculate."""
+    __slots__ = ()
+
+
+class PCMResult(_ResultRecord, namedtuple("PCMResult", [
+        "pcm_mass", "sensible_heat_solid", "latent_heat_capacity", "sensible_heat_liquid",
+        "total_energy", "storage_time", "energy_density"])):
+    """Result of PCMCalculator.calculate."""
+    __slots__ = ()
+
+
+class DimpleResult(_ResultRecord, namedtuple("DimpleResult", [
+        "total_dimples", "enhanced_area", "enhanced_coefficient", "temp_diff",
+        "base_dissipation", "enhanced_dissipation", "improvement"])):
+    """Result of DimpledSurfaceCalculator.calculate."""
+    __slots__ = ()
+
+
+class SystemResult(_ResultRecord, namedtuple("SystemResult", [
+        "thermosiphon_capacity", "heat_pipe_capacity", "pcm_buffer_capacity",
+        "ahu_dissipation", "thermal_coverage", "buffer_time", "energy_savings",
+        "cost_savings", "co2_reduction", "roi_period"])):
+    """Result of SystemPerformanceCalculator.calculate."""
+    __slots__ = ()
 
 
 class ThermosiphonCalculator:
     """Calculates thermosiphon performance metrics."""
     
+    __slots__ = ("params", "water_density", "specific_heat", "thermal_expansion", "gravity",
+                 "friction_factor", "minor_loss")
+    
     def __init__(self, params: InputParameters):
         self.params = params
         # Constants
@@ -36,20 +157,37 @@ class ThermosiphonCalculator:
         
     def calculate(self):
         """Perform thermosiphon calculations."""
+        p = self.params
+        
         # Basic parameters
-        temp_diff = self.params.hot_temp - self.params.cold_temp  # K
-        cold_pipe_area = math.pi * (self.params.cold_pipe_diameter/2)**2  # m²
-        hot_pipe_area = math.pi * (self.params.hot_pipe_diameter/2)**2  # m²
-        pipe_length = self.params.height * 2.5  # m - Total pipe length
+        temp_diff = p.hot_temp - p.cold_temp  # K
+        
+        return ThermoResult(temp_diff, *_thermosiphon_kernel(
+            temp_diff, p.height, p.cold_pipe_area, p.pipe_length, p.heat_load,
+            self.water_density, self.specific_heat, self.thermal_expansion,
+            self.gravity, self.friction_factor, self.minor_loss
+        ))
+        
+    def calculate_array(self, **overrides):
+        """Perform thermosiphon calculations over arrays of input parameters.
+        
+        Any InputParameters field can be overridden with a NumPy array; the
+        results broadcast over the overridden fields.
+        """
+        params = replace(self.params, **overrides)
+        
+        # Basic parameters
+        temp_diff = np.subtract(params.hot_temp, params.cold_temp)  # K
+        cold_pipe_area = params.cold_pipe_area  # m²
+        pipe_length = params.pipe_length  # m - Total pipe length
         
         # Thermosiphon calculations
         density_change = self.water_density * self.thermal_expansion * temp_diff  # kg/m³
-        driving_pressure = density_change * self.gravity * self.params.height  # Pa
+        driving_pressure = density_change * self.gravity * params.height  # Pa
         
-        # Flow rate calculation
-        flow_rate = math.sqrt(
-            (2 * driving_pressure * self.water_density**2 * cold_pipe_area**2) /
-            (self.water_density * (self.friction_factor * pipe_length + self.minor_loss))
+        # Flow rate calculation: A·√(2·ΔP·ρ / (f·L + K))
+        flow_rate = cold_pipe_area * np.sqrt(
+            2 * driving_pressure * self.water_density / (self.friction_factor * pipe_length + self.minor_loss)
         )  # kg/s
         
         volumetric_flow = flow_rate / self.water_density * 1000  # L/s
@@ -57,7 +195,7 @@ class ThermosiphonCalculator:
         
         # Heat transfer capacity
         heat_capacity = flow_rate * self.specific_heat * temp_diff / 1000  # kW
-        system_efficiency = min(heat_capacity / self.params.heat_load * 100, 100)  # %
+        system_efficiency = np.minimum(heat_capacity / params.heat_load * 100, 100)  # %
         
         return {
             "temp_diff": temp_diff,
@@ -74,6 +212,8 @@ class ThermosiphonCalculator:
 class HeatPipeCalculator:
     """Calculates heat pipe performance metrics."""
     
+    __slots__ = ("params", "figure_of_merit", "heat_pipe_length", "interface_loss")
+    
     def __init__(self, params: InputParameters):
         self.params = params
         self.figure_of_merit = 1790  # W/m² - Figure of merit for water
@@ -82,8 +222,7 @@ class HeatPipeCalculator:
         
     def calculate(self):
         """Perform heat pipe calculations."""
-        # Convert mm to m
-        heat_pipe_diameter = self.params.heat_pipe_diameter / 1000  # m
+        heat_pipe_diameter = self.params.heat_pipe_diameter_m  # m
         
         # Heat pipe capacity calculations
         heat_pipe_capacity = self.figure_of_merit * heat_pipe_diameter * self.heat_pipe_length  # W
@@ -97,7 +236,43 @@ class HeatPipeCalculator:
         effective_conductivity = 12000  # W/m·K
         copper_ratio = effective_conductivity / 400  # Ratio to copper
         
-        system_efficiency = min(stage2_capacity / self.params.heat_load * 100, 100)  # %
+        system_efficiency = stage2_capacity / self.params.heat_load * 100  # %
+        if system_efficiency > 100:
+            system_efficiency = 100
+        
+        return HeatPipeResult(
+            heat_pipe_capacity=heat_pipe_capacity,
+            total_capacity=total_capacity,
+            stage1_capacity=stage1_capacity,
+            stage2_capacity=stage2_capacity,
+            effective_conductivity=effective_conductivity,
+            copper_ratio=copper_ratio,
+            system_efficiency=system_efficiency
+        )
+        
+    def calculate_array(self, **overrides):
+        """Perform heat pipe calculations over arrays of input parameters.
+        
+        Any InputParameters field can be overridden with a NumPy array; the
+        results broadcast over the overridden fields.
+        """
+        params = replace(self.params, **overrides)
+        
+        heat_pipe_diameter = params.heat_pipe_diameter_m  # m
+        
+        # Heat pipe capacity calculations
+        heat_pipe_capacity = self.figure_of_merit * heat_pipe_diameter * self.heat_pipe_length  # W
+        total_capacity = heat_pipe_capacity * params.heat_pipe_count / 1000  # kW
+        
+        # Two-stage calculations
+        stage1_capacity = total_capacity  # kW
+        stage2_capacity = stage1_capacity * (1 - self.interface_loss)  # kW
+        
+        # Effective properties
+        effective_conductivity = 12000  # W/m·K
+        copper_ratio = effective_conductivity / 400  # Ratio to copper
+        
+        system_efficiency = np.minimum(stage2_capacity / params.heat_load * 100, 100)  # %
         
         return {
             "heat_pipe_capacity": heat_pipe_capacity,
@@ -113,6 +288,9 @@ class HeatPipeCalculator:
 class PCMCalculator:
     """Calculates PCM performance metrics."""
     
+    __slots__ = ("params", "melting_point", "latent_heat", "pcm_density", "specific_heat_solid",
+                 "specific_heat_liquid", "initial_temp", "final_temp")
+    
     def __init__(self, params: InputParameters):
         self.params = params
         # PCM properties (CaCl₂·6H₂O)
@@ -138,6 +316,36 @@ class PCMCalculator:
         storage_time = total_energy / (self.params.heat_load * 1000) * 60  # minutes
         energy_density = total_energy / (self.params.pcm_volume * 1000)  # kWh/m³
         
+        return PCMResult(
+            pcm_mass=pcm_mass,
+            sensible_heat_solid=sensible_heat_solid,
+            latent_heat_capacity=latent_heat_capacity,
+            sensible_heat_liquid=sensible_heat_liquid,
+            total_energy=total_energy,
+            storage_time=storage_time,
+            energy_density=energy_density
+        )
+        
+    def calculate_array(self, **overrides):
+        """Perform PCM calculations over arrays of input parameters.
+        
+        Any InputParameters field can be overridden with a NumPy array; the
+        results broadcast over the overridden fields.
+        """
+        params = replace(self.params, **overrides)
+        
+        # Basic calculations
+        pcm_mass = self.pcm_density * np.asarray(params.pcm_volume)  # kg
+        
+        # Energy storage calculations
+        sensible_heat_solid = pcm_mass * self.specific_heat_solid * (self.melting_point - self.initial_temp)  # kJ
+        latent_heat_capacity = pcm_mass * self.latent_heat  # kJ
+        sensible_heat_liquid = pcm_mass * self.specific_heat_liquid * (self.final_temp - self.melting_point)  # kJ
+        
+        total_energy = sensible_heat_solid + latent_heat_capacity + sensible_heat_liquid  # kJ
+        storage_time = total_energy / (np.asarray(params.heat_load) * 1000) * 60  # minutes
+        energy_density = total_energy / (np.asarray(params.pcm_volume) * 1000)  # kWh/m³
+        
         return {
             "pcm_mass": pcm_mass,
             "sensible_heat_solid": sensible_heat_solid,
@@ -152,6 +360,9 @@ class PCMCalculator:
 class DimpledSurfaceCalculator:
     """Calculates dimpled surface performance metrics."""
     
+    __slots__ = ("params", "dimple_diameter", "dimple_depth", "surface_area_factor",
+                 "base_heat_transfer", "dimple_enhancement")
+    
     def __init__(self, params: InputParameters):
         self.params = params
         self.dimple_diameter = 0.01  # m
@@ -175,6 +386,37 @@ class DimpledSurfaceCalculator:
         
         improvement = (enhanced_dissipation - base_dissipation) / base_dissipation * 100  # %
         
+        return DimpleResult(
+            total_dimples=total_dimples,
+            enhanced_area=enhanced_area,
+            enhanced_coefficient=enhanced_coefficient,
+            temp_diff=temp_diff,
+            base_dissipation=base_dissipation,
+            enhanced_dissipation=enhanced_dissipation,
+            improvement=improvement
+        )
+        
+    def calculate_array(self, **overrides):
+        """Perform dimpled surface calculations over arrays of input parameters.
+        
+        Any InputParameters field can be overridden with a NumPy array; the
+        results broadcast over the overridden fields.
+        """
+        params = replace(self.params, **overrides)
+        
+        # Basic calculations
+        total_dimples = np.multiply(params.ahu_surface_area, params.dimple_density)  # Total dimples
+        enhanced_area = np.multiply(params.ahu_surface_area, self.surface_area_factor)  # m²
+        
+        # Heat transfer calculations
+        enhanced_coefficient = self.base_heat_transfer * self.dimple_enhancement  # W/m²·K
+        
+        temp_diff = np.subtract(params.cold_temp, params.ambient_temp)  # K
+        base_dissipation = params.ahu_surface_area * self.base_heat_transfer * temp_diff / 1000  # kW
+        enhanced_dissipation = enhanced_area * enhanced_coefficient * temp_diff / 1000  # kW
+        
+        improvement = (enhanced_dissipation - base_dissipation) / base_dissipation * 100  # %
+        
         return {
             "total_dimples": total_dimples,
             "enhanced_area": enhanced_area,
@@ -189,6 +431,10 @@ class DimpledSurfaceCalculator:
 class SystemPerformanceCalculator:
     """Calculates overall system performance metrics."""
     
+    __slots__ = ("params", "thermo_calc", "heat_pipe_calc", "pcm_calc", "dimple_calc",
+                 "conventional_pue", "passive_pue", "electricity_cost", "carbon_factor", "system_cost",
+                 "_cache_key", "_cached_thermo", "_cached_system")
+    
     def __init__(self, params: InputParameters):
         self.params = params
         self.thermo_calc = ThermosiphonCalculator(params)
@@ -203,14 +449,101 @@ class SystemPerformanceCalculator:
         self.carbon_factor = 0.4  # tonnes CO₂/MWh
         self.system_cost = 60000  # $ - Estimated system cost
         
+        # Results of the last calculate(), keyed on the parameter values
+        self._cache_key = None
+        self._cached_thermo = None
+        self._cached_system = None
+        
+    def _cached_results(self):
+        """Return the cached thermosiphon and system results, recalculating if parameters changed."""
+        if self._cache_key != astuple(self.params):
+            self.calculate()
+        return self._cached_thermo, self._cached_system
+        
     def calculate(self):
         """Calculate system performance metrics."""
+        return self.calculate_details()[0]
+        
+    def calculate_details(self):
+        """Like calculate, also returning the sub-calculator results.
+        
+        Returns a (system_results, sub_results) pair, sub_results keyed by
+        sub-system like calculate_all.
+        """
+        cache_key = astuple(self.params)
+        
         # Get results from individual calculators
         thermo_results = self.thermo_calc.calculate()
         heat_pipe_results = self.heat_pipe_calc.calculate()
         pcm_results = self.pcm_calc.calculate()
         dimple_results = self.dimple_calc.calculate()
         
+        # System capacity calculations
+        thermosiphon_capacity = thermo_results.heat_capacity  # kW
+        heat_pipe_capacity = heat_pipe_results.stage2_capacity  # kW
+        pcm_buffer_capacity = pcm_results.total_energy / 3600  # kWh
+        ahu_dissipation = dimple_results.enhanced_dissipation  # kW
+        
+        # Performance metrics
+        limiting_capacity = heat_pipe_capacity if heat_pipe_capacity < thermosiphon_capacity else thermosiphon_capacity  # kW
+        thermal_coverage = limiting_capacity / self.params.heat_load * 100  # %
+        if thermal_coverage > 100:
+            thermal_coverage = 100
+        buffer_time = pcm_results.storage_time  # minutes
+        
+        # Energy and cost calculations
+        energy_savings = (self.conventional_pue - self.passive_pue) / self.conventional_pue * self.params.heat_load * 24 * 365 / 1000  # MWh/year
+        cost_savings = energy_savings * self.electricity_cost * 1000  # $/year
+        co2_reduction = energy_savings * self.carbon_factor  # tonnes/year
+        roi_period = self.system_cost / cost_savings  # years
+        
+        system_results = SystemResult(
+            thermosiphon_capacity=thermosiphon_capacity,
+            heat_pipe_capacity=heat_pipe_capacity,
+            pcm_buffer_capacity=pcm_buffer_capacity,
+            ahu_dissipation=ahu_dissipation,
+            thermal_coverage=thermal_coverage,
+            buffer_time=buffer_time,
+            energy_savings=energy_savings,
+            cost_savings=cost_savings,
+            co2_reduction=co2_reduction,
+            roi_period=roi_period
+        )
+        
+        self._cache_key = cache_key
+        self._cached_thermo = thermo_results
+        self._cached_system = system_results
+        
+        return system_results, {
+            "thermosiphon": thermo_results,
+            "heat_pipes": heat_pipe_results,
+            "pcm": pcm_results,
+            "dimpled_surface": dimple_results
+        }
+        
+    def calculate_array(self, **overrides):
+        """Calculate system performance metrics over arrays of input parameters.
+        
+        Any InputParameters field can be overridden with a NumPy array; each
+        sub-calculation runs once over the whole sweep instead of once per
+        value, and the results broadcast over the overridden fields.
+        """
+        return self.calculate_array_details(**overrides)[0]
+        
+    def calculate_array_details(self, **overrides):
+        """Like calculate_array, also returning the sub-calculator results.
+        
+        Returns a (system_results, sub_results) pair of dicts of arrays;
+        nothing is stored on the calculator, so concurrent calls are safe.
+        """
+        heat_load = np.asarray(overrides.get("heat_load", self.params.heat_load))
+        
+        # Get results from individual calculators
+        thermo_results = self.thermo_calc.calculate_array(**overrides)
+        heat_pipe_results = self.heat_pipe_calc.calculate_array(**overrides)
+        pcm_results = self.pcm_calc.calculate_array(**overrides)
+        dimple_results = self.dimple_calc.calculate_array(**overrides)
+        
         # System capacity calculations
         thermosiphon_capacity = thermo_results["heat_capacity"]  # kW
         heat_pipe_capacity = heat_pipe_results["stage2_capacity"]  # kW
@@ -218,15 +551,22 @@ class SystemPerformanceCalculator:
         ahu_dissipation = dimple_results["enhanced_dissipation"]  # kW
         
         # Performance metrics
-        thermal_coverage = min(min(thermosiphon_capacity, heat_pipe_capacity) / self.params.heat_load * 100, 100)  # %
+        thermal_coverage = np.minimum(np.minimum(thermosiphon_capacity, heat_pipe_capacity) / heat_load * 100, 100)  # %
         buffer_time = pcm_results["storage_time"]  # minutes
         
         # Energy and cost calculations
-        energy_savings = (self.conventional_pue - self.passive_pue) / self.conventional_pue * self.params.heat_load * 24 * 365 / 1000  # MWh/year
+        energy_savings = (self.conventional_pue - self.passive_pue) / self.conventional_pue * heat_load * 24 * 365 / 1000  # MWh/year
         cost_savings = energy_savings * self.electricity_cost * 1000  # $/year
         co2_reduction = energy_savings * self.carbon_factor  # tonnes/year
         roi_period = self.system_cost / cost_savings  # years
         
+        sub_results = {
+            "thermosiphon": thermo_results,
+            "heat_pipes": heat_pipe_results,
+            "pcm": pcm_results,
+            "dimpled_surface": dimple_results
+        }
+        
         return {
             "thermosiphon_capacity": thermosiphon_capacity,
             "heat_pipe_capacity": heat_pipe_capacity,
@@ -238,12 +578,24 @@ class SystemPerformanceCalculator:
             "cost_savings": cost_savings,
             "co2_reduction": co2_reduction,
             "roi_period": roi_period
-        }
+        }, sub_results
         
-    def validate_parameters(self):
-        """Validate input parameters against recommended ranges."""
+    def validate_parameters(self, results=None, thermo_results=None):
+        """Validate input parameters against recommended ranges.
+        
+        results and thermo_results can pass in the system and thermosiphon
+        results for the current parameters; any not given come from the cache.
+        """
         validations = {}
         
+        system_results = results
+        if system_results is None or thermo_results is None:
+            cached_thermo, cached_system = self._cached_results()
+            if system_results is None:
+                system_results = cached_system
+            if thermo_results is None:
+                thermo_results = cached_thermo
+        
         # Height validation
         validations["height"] = "OK" if self.params.height >= 5 else "TOO LOW"
         
@@ -252,7 +604,7 @@ class SystemPerformanceCalculator:
         validations["temp_diff"] = "OK" if 5 <= temp_diff <= 20 else "CHECK RANGE"
         
         # Flow velocity validation
-        flow_velocity = self.thermo_calc.calculate()["flow_velocity"]
+        flow_velocity = thermo_results.flow_velocity
         validations["flow_velocity"] = "OK" if 0.1 <= flow_velocity <= 2.0 else "CHECK RANGE"
         
         # Heat pipe count validation
@@ -262,7 +614,7 @@ class SystemPerformanceCalculator:
         validations["pcm_volume"] = "OK" if 0.3 <= self.params.pcm_volume <= 2.0 else "CHECK RANGE"
         
         # Capacity coverage validation
-        thermal_coverage = self.calculate()["thermal_coverage"]
+        thermal_coverage = system_results.thermal_coverage
         validations["capacity_coverage"] = "OK" if thermal_coverage >= 60 else "INSUFFICIENT"
         
         return validations
@@ -271,6 +623,8 @@ class SystemPerformanceCalculator:
 class PassiveCoolingCalculator:
     """Main calculator class for passive cooling system."""
     
+    __slots__ = ("params", "system_calc")
+    
     def __init__(self, params: InputParameters = None):
         """Initialize with default parameters if none provided."""
         if params is None:
@@ -296,23 +650,87 @@ class PassiveCoolingCalculator:
         
     def calculate_all(self):
         """Calculate all metrics and return comprehensive results."""
-        thermo_results = ThermosiphonCalculator(self.params).calculate()
-        heat_pipe_results = HeatPipeCalculator(self.params).calculate()
-        pcm_results = PCMCalculator(self.params).calculate()
-        dimple_results = DimpledSurfaceCalculator(self.params).calculate()
-        system_results = self.system_calc.calculate()
-        validations = self.system_calc.validate_parameters()
+        # The system calculation runs every sub-calculator; reuse their results
+        system_results, sub_results = self.system_calc.calculate_details()
+        validations = self.system_calc.validate_parameters(
+            system_results, sub_results["thermosiphon"]
+        )
         
         return {
             "input_parameters": self.params,
-            "thermosiphon": thermo_results,
-            "heat_pipes": heat_pipe_results,
-            "pcm": pcm_results,
-            "dimpled_surface": dimple_results,
+            "thermosiphon": sub_results["thermosiphon"],
+            "heat_pipes": sub_results["heat_pipes"],
+            "pcm": sub_results["pcm"],
+            "dimpled_surface": sub_results["dimpled_surface"],
             "system_performance": system_results,
             "validations": validations
         }
     
+    def sweep(self, param_name, values):
+        """Evaluate the system over a range of values of one input parameter.
+        
+        All sub-calculations run in a single vectorized pass; the other
+        parameters are held at their current values.
+        
+        Returns a dict of arrays shaped like values: the system performance
+        metrics plus the thermosiphon flow results.
+        """
+        if param_name not in InputParameters.__dataclass_fields__:
+            raise ValueError(f"Unknown parameter: {param_name}")
+        # Contiguous float64 so the ufuncs (np.sqrt in the flow rate) take their SIMD loops
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        
+        results, sub_results = self.system_calc.calculate_array_details(**{param_name: values})
+        thermo_results = sub_results["thermosiphon"]
+        for key in ("density_change", "driving_pressure", "flow_rate", "volumetric_flow", "flow_velocity"):
+            results[key] = thermo_results[key]
+        
+        # Parameters the sweep does not touch give scalars; expand them to the sweep
+        return {key: np.full(values.shape, value) if np.ndim(value) == 0 else value
+                for key, value in results.items()}
+    
+    def sweep_parallel(self, max_workers=None, chunk_size=65536, **arrays):
+        """Evaluate the system for many sampled parameter sets, e.g. Monte Carlo.
+        
+        Each keyword is an InputParameters field with one value per sample;
+        fields not given stay at their current value. Large batches are split
+        into chunks evaluated on a thread pool, which runs in parallel because
+        NumPy releases the GIL inside its array loops.
+        
+        Returns a dict of thermosiphon_capacity, thermal_coverage and
+        roi_period arrays, one value per sample.
+        """
+        # Imported here to keep it (and logging, which it loads) off the GUI startup path
+        from concurrent.futures import ThreadPoolExecutor
+        
+        for name in arrays:
+            if name not in InputParameters.__dataclass_fields__:
+                raise ValueError(f"Unknown parameter: {name}")
+        names = list(arrays)
+        columns = np.broadcast_arrays(*(np.asarray(arrays[name]) for name in names))
+        shape = columns[0].shape if columns else ()
+        columns = [np.ascontiguousarray(column.ravel(), dtype=np.float64) for column in columns]
+        size = columns[0].size if columns else 1
+        
+        out = {key: np.empty(size) for key in ("thermosiphon_capacity", "thermal_coverage", "roi_period")}
+        
+        def run_chunk(start):
+            stop = min(start + chunk_size, size)
+            results = self.system_calc.calculate_array(
+                **{name: column[start:stop] for name, column in zip(names, columns)}
+            )
+            for key, values in out.items():
+                values[start:stop] = results[key]
+        
+        starts = range(0, size, chunk_size)
+        if len(starts) == 1:
+            run_chunk(0)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(run_chunk, starts))
+        
+        return {key: values.reshape(shape) for key, values in out.items()}
+    
     def print_report(self):
         """Print a comprehensive report of all calculations."""
         results = self.calculate_all()
@@ -320,7 +738,7 @@ class PassiveCoolingCalculator:
         print("\n===== PASSIVE COOLING SYSTEM REPORT =====\n")
         
         print("INPUT PARAMETERS:")
-        for key, value in vars(self.params).items():
+        for key, value in asdict(self.params).items():
             print(f"  {key}: {value}")
         
         print("\nTHERMOSIPHON PERFORMANCE:")
@@ -351,21 +769,17 @@ class PassiveCoolingCalculator:
     
     def plot_performance(self):
         """Generate performance plots."""
+        # Imported here so headless use of the calculators does not load matplotlib
+        import matplotlib.pyplot as plt
+        
         # Create figure with subplots
         fig, axs = plt.subplots(2, 2, figsize=(12, 10))
         
         # Calculate with varying height
         heights = np.linspace(5, 15, 10)
-        capacities = []
-        efficiencies = []
-        
-        for height in heights:
-            params_copy = InputParameters(**vars(self.params))
-            params_copy.height = height
-            calculator = SystemPerformanceCalculator(params_copy)
-            results = calculator.calculate()
-            capacities.append(results["thermosiphon_capacity"])
-            efficiencies.append(results["thermal_coverage"])
+        results = self.sweep("height", heights)
+        capacities = results["thermosiphon_capacity"]
+        efficiencies = results["thermal_coverage"]
         
         # Plot height vs capacity
         axs[0, 0].plot(heights, capacities, 'b-o')
@@ -376,14 +790,7 @@ class PassiveCoolingCalculator:
         
         # Calculate with varying PCM volume
         volumes = np.linspace(0.2, 1.0, 10)
-        buffer_times = []
-        
-        for volume in volumes:
-            params_copy = InputParameters(**vars(self.params))
-            params_copy.pcm_volume = volume
-            calculator = PCMCalculator(params_copy)
-            results = calculator.calculate()
-            buffer_times.append(results["storage_time"])
+        buffer_times = self.sweep("pcm_volume", volumes)["buffer_time"]
         
         # Plot PCM volume vs buffer time
         axs[0, 1].plot(volumes, buffer_times, 'r-o')
@@ -394,14 +801,7 @@ class PassiveCoolingCalculator:
         
         # Calculate with varying heat pipe count
         pipe_counts = np.linspace(50, 200, 10)
-        pipe_capacities = []
-        
-        for count in pipe_counts:
-            params_copy = InputParameters(**vars(self.params))
-            params_copy.heat_pipe_count = int(count)
-            calculator = HeatPipeCalculator(params_copy)
-            results = calculator.calculate()
-            pipe_capacities.append(results["stage2_capacity"])
+        pipe_capacities = self.sweep("heat_pipe_count", pipe_counts.astype(int))["heat_pipe_capacity"]
         
         # Plot heat pipe count vs capacity
         axs[1, 0].plot(pipe_counts, pipe_capacities, 'g-o')
@@ -412,14 +812,7 @@ class PassiveCoolingCalculator:
         
         # Calculate ROI for different heat loads
         heat_loads = np.linspace(50, 150, 10)
-        roi_periods = []
-        
-        for load in heat_loads:
-            params_copy = InputParameters(**vars(self.params))
-            params_copy.heat_load = load
-            calculator = SystemPerformanceCalculator(params_copy)
-            results = calculator.calculate()
-            roi_periods.append(results["roi_period"])
+        roi_periods = self.sweep("heat_load", heat_loads)["roi_period"]
         
         # Plot heat load vs ROI
         axs[1, 1].plot(heat_loads, roi_periods, 'm-o')
@@ -4,6 +4,7 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
 import json
+import math
 import os
 import sys
 from dataclasses import dataclass, asdict
@@ -101,12 +102,122 @@ except ImportError:
                 }
             }
         
+        def sweep(self, param_name, values):
+            # Mock sweep: the mock system results at every value
+            system_results = self.calculate_all()["system_performance"]
+            return {key: np.full(len(values), value) for key, value in system_results.items()}
+        
         def plot_performance(self):
             # Create a figure with subplots
             fig = plt.figure(figsize=(12, 10))
             return fig
 
 
+# Rear door layout assumptions
+_PIPE_CROSS_AREA = 0.01 * 0.5  # m² - Assume 1cm x 50cm pipe cross-section
+_INV_PIPE_CROSS_AREA = 1.0 / _PIPE_CROSS_AREA  # 1/m²
+_FAN_POWER = 0.12  # kW per fan - Assume 120W per fan
+_LMTD_TOLERANCE = 1e-9  # K - End temperature differences closer than this are balanced flow
+
+# Result keys of RearDoorCalculator.calculate, in _rear_door_kernel order
+_RDH_RESULT_KEYS = (
+    "water_heat_capacity", "air_heat_capacity", "effectiveness", "heat_transfer_coefficient",
+    "passive_cooling_capacity", "passive_percentage", "thermal_coverage", "water_velocity",
+    "air_velocity", "fan_power",
+)
+
+
+def _log_mean_temp_diff(hot_end_diff, cold_end_diff):
+    """Log mean temperature difference from the end temperature differences.
+    
+    Takes floats or NumPy arrays. Balanced flow (equal end differences)
+    gives that difference; end differences of opposite sign or zero give NaN.
+    """
+    difference = hot_end_diff - cold_end_diff
+    if isinstance(difference, np.ndarray):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(
+                np.abs(difference) < _LMTD_TOLERANCE,
+                hot_end_diff,
+                np.where(hot_end_diff * cold_end_diff > 0,
+                         difference / np.log1p(difference / cold_end_diff), np.nan)
+            )
+    if abs(difference) < _LMTD_TOLERANCE:
+        return hot_end_diff
+    if hot_end_diff * cold_end_diff <= 0:
+        return math.nan
+    # log(dt1 / dt2) as log1p((dt1 - dt2) / dt2), accurate near balanced flow
+    return difference / math.log1p(difference / cold_end_diff)
+
+
+def _rear_door_kernel(server_heat_load, inlet_water_temp, outlet_water_temp, inlet_air_temp,
+                      outlet_air_temp, water_flow_rate, air_flow_rate, fan_count,
+                      door_width, door_height):
+    """Rear door heat exchanger performance on floats or NumPy arrays.
+    
+    Shared by RearDoorCalculator.calculate and calculate_batch; array
+    arguments broadcast against each other. Returns a tuple of the values
+    named in _RDH_RESULT_KEYS.
+    """
+    # Convert units
+    water_flow_m3s = water_flow_rate / 1000  # L/s to m³/s
+    air_flow_m3s = air_flow_rate / 3600  # m³/h to m³/s
+    
+    # Water properties
+    water_density = 997  # kg/m³
+    water_cp = 4186  # J/kg·K
+    
+    # Air properties
+    air_density = 1.2  # kg/m³
+    air_cp = 1005  # J/kg·K
+    
+    # Calculate heat transfer based on water side
+    water_mass_flow = water_flow_m3s * water_density  # kg/s
+    water_delta_t = outlet_water_temp - inlet_water_temp  # K
+    water_heat_capacity = water_mass_flow * water_cp * water_delta_t / 1000  # kW
+    
+    # Calculate heat transfer based on air side
+    air_mass_flow = air_flow_m3s * air_density  # kg/s
+    air_delta_t = inlet_air_temp - outlet_air_temp  # K
+    air_heat_capacity = air_mass_flow * air_cp * air_delta_t / 1000  # kW
+    
+    # Calculate heat transfer effectiveness
+    max_delta_t = inlet_air_temp - inlet_water_temp  # K
+    effectiveness = water_delta_t / max_delta_t * 100  # %
+    
+    # Calculate heat transfer coefficient
+    door_area = door_width * door_height  # m²
+    log_mean_temp_diff = _log_mean_temp_diff(inlet_air_temp - outlet_water_temp,
+                                             outlet_air_temp - inlet_water_temp)
+    heat_transfer_coef = water_heat_capacity * 1000 / (door_area * log_mean_temp_diff)  # W/m²·K
+    
+    # Calculate passive mode performance (no fans)
+    passive_air_flow = air_flow_m3s * 0.3  # Assume 30% flow without fans
+    passive_air_mass_flow = passive_air_flow * air_density
+    passive_delta_t = inlet_air_temp - (inlet_air_temp - 15)  # Assume less effective cooling
+    passive_capacity = passive_air_mass_flow * air_cp * passive_delta_t / 1000  # kW
+    passive_percentage = passive_capacity / server_heat_load * 100  # %
+    
+    thermal_coverage = water_heat_capacity / server_heat_load * 100  # %
+    if isinstance(thermal_coverage, np.ndarray):
+        thermal_coverage = np.minimum(thermal_coverage, 100)
+    elif thermal_coverage > 100:
+        thermal_coverage = 100
+    
+    return (
+        water_heat_capacity,
+        air_heat_capacity,
+        effectiveness,
+        heat_transfer_coef,
+        passive_capacity,
+        passive_percentage,
+        thermal_coverage,
+        water_flow_m3s * _INV_PIPE_CROSS_AREA,
+        air_flow_m3s / door_area,
+        fan_count * _FAN_POWER
+    )
+
+
 class RearDoorCalculator:
     """Calculator for Rear Door Heat Exchanger performance."""
     
@@ -131,59 +242,28 @@ class RearDoorCalculator:
         """Calculate rear door heat exchanger performance."""
         p = self.params
         
-        # Convert units
-        water_flow_m3s = p["water_flow_rate"] / 1000  # L/s to m³/s
-        air_flow_m3s = p["air_flow_rate"] / 3600  # m³/h to m³/s
-        
-        # Water properties
-        water_density = 997  # kg/m³
-        water_cp = 4186  # J/kg·K
-        
-        # Air properties
-        air_density = 1.2  # kg/m³
-        air_cp = 1005  # J/kg·K
-        
-        # Calculate heat transfer based on water side
-        water_mass_flow = water_flow_m3s * water_density  # kg/s
-        water_delta_t = p["outlet_water_temp"] - p["inlet_water_temp"]  # K
-        water_heat_capacity = water_mass_flow * water_cp * water_delta_t / 1000  # kW
-        
-        # Calculate heat transfer based on air side
-        air_mass_flow = air_flow_m3s * air_density  # kg/s
-        air_delta_t = p["inlet_air_temp"] - p["outlet_air_temp"]  # K
-        air_heat_capacity = air_mass_flow * air_cp * air_delta_t / 1000  # kW
-        
-        # Calculate heat transfer effectiveness
-        max_delta_t = p["inlet_air_temp"] - p["inlet_water_temp"]  # K
-        effectiveness = water_delta_t / max_delta_t * 100  # %
-        
-        # Calculate heat transfer coefficient
-        door_area = p["door_width"] * p["door_height"]  # m²
-        log_mean_temp_diff = ((p["inlet_air_temp"] - p["outlet_water_temp"]) - 
-                             (p["outlet_air_temp"] - p["inlet_water_temp"])) / \
-                             np.log((p["inlet_air_temp"] - p["outlet_water_temp"]) / 
-                                   (p["outlet_air_temp"] - p["inlet_water_temp"]))
-        heat_transfer_coef = water_heat_capacity * 1000 / (door_area * log_mean_temp_diff)  # W/m²·K
-        
-        # Calculate passive mode performance (no fans)
-        passive_air_flow = air_flow_m3s * 0.3  # Assume 30% flow without fans
-        passive_air_mass_flow = passive_air_flow * air_density
-        passive_delta_t = p["inlet_air_temp"] - (p["inlet_air_temp"] - 15)  # Assume less effective cooling
-        passive_capacity = passive_air_mass_flow * air_cp * passive_delta_t / 1000  # kW
-        passive_percentage = passive_capacity / p["server_heat_load"] * 100  # %
-        
-        return {
-            "water_heat_capacity": water_heat_capacity,
-            "air_heat_capacity": air_heat_capacity,
-            "effectiveness": effectiveness,
-            "heat_transfer_coefficient": heat_transfer_coef,
-            "passive_cooling_capacity": passive_capacity,
-            "passive_percentage": passive_percentage,
-            "thermal_coverage": min(water_heat_capacity / p["server_heat_load"] * 100, 100),
-            "water_velocity": water_flow_m3s / (0.01 * 0.5),  # Assume 1cm x 50cm pipe cross-section
-            "air_velocity": air_flow_m3s / (p["door_width"] * p["door_height"]),
-            "fan_power": p["fan_count"] * 0.12  # Assume 120W per fan
-        }
+        return dict(zip(_RDH_RESULT_KEYS, _rear_door_kernel(
+            p["server_heat_load"], p["inlet_water_temp"], p["outlet_water_temp"],
+            p["inlet_air_temp"], p["outlet_air_temp"], p["water_flow_rate"],
+            p["air_flow_rate"], p["fan_count"], p["door_width"], p["door_height"]
+        )))
+    
+    def calculate_batch(self, params_arr):
+        """Calculate rear door heat exchanger performance for many racks at once.
+        
+        params_arr is a structured NumPy array or a dict of arrays keyed like
+        self.params, one element per rack. Fields it does not provide are
+        taken from self.params. Returns the same keys as calculate(), as arrays.
+        """
+        fields = params_arr.dtype.names if isinstance(params_arr, np.ndarray) else params_arr
+        p = {key: np.asarray(params_arr[key], dtype=float) if key in fields else value
+             for key, value in self.params.items()}
+        
+        return dict(zip(_RDH_RESULT_KEYS, _rear_door_kernel(
+            p["server_heat_load"], p["inlet_water_temp"], p["outlet_water_temp"],
+            p["inlet_air_temp"], p["outlet_air_temp"], p["water_flow_rate"],
+            p["air_flow_rate"], p["fan_count"], p["door_width"], p["door_height"]
+        )))
 
 
 class ThermalCalculatorApp:
@@ -257,6 +337,40 @@ class ThermalCalculatorApp:
         self.setup_rdh_tab()
         self.setup_results_tab()
         
+        # Input variables by parameter name; update_parameters and
+        # update_rdh_parameters only read back the ones written since
+        self._param_vars = {
+            "heat_load": self.heat_load_var,
+            "ambient_temp": self.ambient_temp_var,
+            "height": self.height_var,
+            "cold_pipe_diameter": self.cold_pipe_diameter_var,
+            "hot_pipe_diameter": self.hot_pipe_diameter_var,
+            "cold_temp": self.cold_temp_var,
+            "hot_temp": self.hot_temp_var,
+            "heat_pipe_count": self.heat_pipe_count_var,
+            "heat_pipe_diameter": self.heat_pipe_diameter_var,
+            "pcm_volume": self.pcm_volume_var,
+            "ahu_surface_area": self.ahu_surface_area_var,
+            "dimple_density": self.dimple_density_var,
+        }
+        self._rdh_vars = {
+            "server_heat_load": self.rdh_heat_load_var,
+            "inlet_water_temp": self.rdh_inlet_water_var,
+            "outlet_water_temp": self.rdh_outlet_water_var,
+            "inlet_air_temp": self.rdh_inlet_air_var,
+            "outlet_air_temp": self.rdh_outlet_air_var,
+            "water_flow_rate": self.rdh_water_flow_var,
+            "air_flow_rate": self.rdh_air_flow_var,
+            "fan_count": self.rdh_fan_count_var,
+            "coil_rows": self.rdh_coil_rows_var,
+            "door_width": self.rdh_door_width_var,
+            "door_height": self.rdh_door_height_var,
+        }
+        self._dirty_params = self._track_writes(self._param_vars)
+        self._dirty_rdh = self._track_writes(self._rdh_vars)
+        self._synced_params = self.params
+        self._synced_rdh_params = self.rdh_params
+        
         # Create the calculator object
         self.calculator = PassiveCoolingCalculator(self.params)
         self.rdh_calculator = RearDoorCalculator(self.rdh_params)
@@ -1217,115 +1331,114 @@ class ThermalCalculatorApp:
         self.roi_label.config(text=f"ROI Period: {system_perf['roi_period']:.2f} years")
         self.efficiency_label.config(text=f"System Efficiency: {min(system_perf['thermal_coverage'], 100):.1f}%")
     
+    @staticmethod
+    def _set_tree_rows(tree, rows):
+        """Set the values of every row of a results tree in one Tcl call.
+        
+        Rows are updated in place; the tree is only refilled if the number
+        of rows changed.
+        """
+        iids = tree.get_children()
+        if len(iids) != len(rows):
+            if iids:
+                tree.delete(*iids)
+            iids = [tree.insert("", tk.END) for _ in rows]
+        
+        # A Tcl lambda loops over (iid, values) pairs so the updates cost a single dispatch
+        pairs = tuple(item for pair in zip(iids, rows) for item in pair)
+        tree.tk.call("apply", ("pairs", f"foreach {{iid values}} $pairs {{{tree._w} item $iid -values $values}}"), pairs)
+    
     def update_thermosiphon_results(self, results):
         """Update the thermosiphon results tree."""
         thermo = results["thermosiphon"]
         
-        # Clear existing data
-        for item in self.thermo_results_tree.get_children():
-            self.thermo_results_tree.delete(item)
-        
-        # Add new data
-        self.thermo_results_tree.insert("", tk.END, values=("Temperature Difference", f"{thermo['temp_diff']:.2f}", "K"))
-        self.thermo_results_tree.insert("", tk.END, values=("Density Change", f"{thermo['density_change']:.4f}", "kg/m³"))
-        self.thermo_results_tree.insert("", tk.END, values=("Driving Pressure", f"{thermo['driving_pressure']:.2f}", "Pa"))
-        self.thermo_results_tree.insert("", tk.END, values=("Flow Rate", f"{thermo['flow_rate']:.2f}", "kg/s"))
-        self.thermo_results_tree.insert("", tk.END, values=("Volumetric Flow", f"{thermo['volumetric_flow']:.2f}", "L/s"))
-        self.thermo_results_tree.insert("", tk.END, values=("Flow Velocity", f"{thermo['flow_velocity']:.2f}", "m/s"))
-        self.thermo_results_tree.insert("", tk.END, values=("Heat Capacity", f"{thermo['heat_capacity']:.2f}", "kW"))
-        self.thermo_results_tree.insert("", tk.END, values=("System Efficiency", f"{thermo['system_efficiency']:.2f}", "%"))
+        self._set_tree_rows(self.thermo_results_tree, [
+            ("Temperature Difference", f"{thermo['temp_diff']:.2f}", "K"),
+            ("Density Change", f"{thermo['density_change']:.4f}", "kg/m³"),
+            ("Driving Pressure", f"{thermo['driving_pressure']:.2f}", "Pa"),
+            ("Flow Rate", f"{thermo['flow_rate']:.2f}", "kg/s"),
+            ("Volumetric Flow", f"{thermo['volumetric_flow']:.2f}", "L/s"),
+            ("Flow Velocity", f"{thermo['flow_velocity']:.2f}", "m/s"),
+            ("Heat Capacity", f"{thermo['heat_capacity']:.2f}", "kW"),
+            ("System Efficiency", f"{thermo['system_efficiency']:.2f}", "%"),
+        ])
     
     def update_heat_pipe_results(self, results):
         """Update the heat pipe results tree."""
         heat_pipes = results["heat_pipes"]
         
-        # Clear existing data
-        for item in self.heat_pipe_results_tree.get_children():
-            self.heat_pipe_results_tree.delete(item)
-        
-        # Add new data
-        self.heat_pipe_results_tree.insert("", tk.END, values=("Heat Pipe Capacity", f"{heat_pipes['heat_pipe_capacity']:.2f}", "W"))
-        self.heat_pipe_results_tree.insert("", tk.END, values=("Total Capacity", f"{heat_pipes['total_capacity']:.2f}", "kW"))
-        self.heat_pipe_results_tree.insert("", tk.END, values=("Stage 1 Capacity", f"{heat_pipes['stage1_capacity']:.2f}", "kW"))
-        self.heat_pipe_results_tree.insert("", tk.END, values=("Stage 2 Capacity", f"{heat_pipes['stage2_capacity']:.2f}", "kW"))
-        self.heat_pipe_results_tree.insert("", tk.END, values=("Effective Conductivity", f"{heat_pipes['effective_conductivity']:.0f}", "W/m·K"))
-        self.heat_pipe_results_tree.insert("", tk.END, values=("Copper Ratio", f"{heat_pipes['copper_ratio']:.0f}", "x"))
-        self.heat_pipe_results_tree.insert("", tk.END, values=("System Efficiency", f"{heat_pipes['system_efficiency']:.2f}", "%"))
+        self._set_tree_rows(self.heat_pipe_results_tree, [
+            ("Heat Pipe Capacity", f"{heat_pipes['heat_pipe_capacity']:.2f}", "W"),
+            ("Total Capacity", f"{heat_pipes['total_capacity']:.2f}", "kW"),
+            ("Stage 1 Capacity", f"{heat_pipes['stage1_capacity']:.2f}", "kW"),
+            ("Stage 2 Capacity", f"{heat_pipes['stage2_capacity']:.2f}", "kW"),
+            ("Effective Conductivity", f"{heat_pipes['effective_conductivity']:.0f}", "W/m·K"),
+            ("Copper Ratio", f"{heat_pipes['copper_ratio']:.0f}", "x"),
+            ("System Efficiency", f"{heat_pipes['system_efficiency']:.2f}", "%"),
+        ])
     
     def update_pcm_results(self, results):
         """Update the PCM results tree."""
         pcm = results["pcm"]
         
-        # Clear existing data
-        for item in self.pcm_results_tree.get_children():
-            self.pcm_results_tree.delete(item)
-        
-        # Add new data
-        self.pcm_results_tree.insert("", tk.END, values=("PCM Mass", f"{pcm['pcm_mass']:.2f}", "kg"))
-        self.pcm_results_tree.insert("", tk.END, values=("Sensible Heat (Solid)", f"{pcm['sensible_heat_solid']:.2f}", "kJ"))
-        self.pcm_results_tree.insert("", tk.END, values=("Latent Heat Capacity", f"{pcm['latent_heat_capacity']:.2f}", "kJ"))
-        self.pcm_results_tree.insert("", tk.END, values=("Sensible Heat (Liquid)", f"{pcm['sensible_heat_liquid']:.2f}", "kJ"))
-        self.pcm_results_tree.insert("", tk.END, values=("Total Energy Storage", f"{pcm['total_energy']:.2f}", "kJ"))
-        self.pcm_results_tree.insert("", tk.END, values=("Storage Time", f"{pcm['storage_time']:.2f}", "min"))
-        self.pcm_results_tree.insert("", tk.END, values=("Energy Density", f"{pcm['energy_density']:.2f}", "kWh/m³"))
+        self._set_tree_rows(self.pcm_results_tree, [
+            ("PCM Mass", f"{pcm['pcm_mass']:.2f}", "kg"),
+            ("Sensible Heat (Solid)", f"{pcm['sensible_heat_solid']:.2f}", "kJ"),
+            ("Latent Heat Capacity", f"{pcm['latent_heat_capacity']:.2f}", "kJ"),
+            ("Sensible Heat (Liquid)", f"{pcm['sensible_heat_liquid']:.2f}", "kJ"),
+            ("Total Energy Storage", f"{pcm['total_energy']:.2f}", "kJ"),
+            ("Storage Time", f"{pcm['storage_time']:.2f}", "min"),
+            ("Energy Density", f"{pcm['energy_density']:.2f}", "kWh/m³"),
+        ])
     
     def update_dimple_results(self, results):
         """Update the dimpled surface results tree."""
         dimple = results["dimpled_surface"]
         
-        # Clear existing data
-        for item in self.dimple_results_tree.get_children():
-            self.dimple_results_tree.delete(item)
-        
-        # Add new data
-        self.dimple_results_tree.insert("", tk.END, values=("Total Dimples", f"{dimple['total_dimples']:.0f}", ""))
-        self.dimple_results_tree.insert("", tk.END, values=("Enhanced Surface Area", f"{dimple['enhanced_area']:.2f}", "m²"))
-        self.dimple_results_tree.insert("", tk.END, values=("Enhanced Heat Transfer Coefficient", f"{dimple['enhanced_coefficient']:.2f}", "W/m²·K"))
-        self.dimple_results_tree.insert("", tk.END, values=("Temperature Difference", f"{dimple['temp_diff']:.2f}", "K"))
-        self.dimple_results_tree.insert("", tk.END, values=("Base Heat Dissipation", f"{dimple['base_dissipation']:.2f}", "kW"))
-        self.dimple_results_tree.insert("", tk.END, values=("Enhanced Heat Dissipation", f"{dimple['enhanced_dissipation']:.2f}", "kW"))
-        self.dimple_results_tree.insert("", tk.END, values=("Improvement", f"{dimple['improvement']:.2f}", "%"))
+        self._set_tree_rows(self.dimple_results_tree, [
+            ("Total Dimples", f"{dimple['total_dimples']:.0f}", ""),
+            ("Enhanced Surface Area", f"{dimple['enhanced_area']:.2f}", "m²"),
+            ("Enhanced Heat Transfer Coefficient", f"{dimple['enhanced_coefficient']:.2f}", "W/m²·K"),
+            ("Temperature Difference", f"{dimple['temp_diff']:.2f}", "K"),
+            ("Base Heat Dissipation", f"{dimple['base_dissipation']:.2f}", "kW"),
+            ("Enhanced Heat Dissipation", f"{dimple['enhanced_dissipation']:.2f}", "kW"),
+            ("Improvement", f"{dimple['improvement']:.2f}", "%"),
+        ])
     
     def update_rdh_results(self, results):
         """Update the RDHx results tree."""
-        # Clear existing data
-        for item in self.rdh_results_tree.get_children():
-            self.rdh_results_tree.delete(item)
-        
-        # Add new data
-        self.rdh_results_tree.insert("", tk.END, values=("Water Heat Capacity", f"{results['water_heat_capacity']:.2f}", "kW"))
-        self.rdh_results_tree.insert("", tk.END, values=("Air Heat Capacity", f"{results['air_heat_capacity']:.2f}", "kW"))
-        self.rdh_results_tree.insert("", tk.END, values=("Effectiveness", f"{results['effectiveness']:.2f}", "%"))
-        self.rdh_results_tree.insert("", tk.END, values=("Heat Transfer Coefficient", f"{results['heat_transfer_coefficient']:.2f}", "W/m²·K"))
-        self.rdh_results_tree.insert("", tk.END, values=("Passive Cooling Capacity", f"{results['passive_cooling_capacity']:.2f}", "kW"))
-        self.rdh_results_tree.insert("", tk.END, values=("Passive Percentage", f"{results['passive_percentage']:.2f}", "%"))
-        self.rdh_results_tree.insert("", tk.END, values=("Thermal Coverage", f"{results['thermal_coverage']:.2f}", "%"))
-        self.rdh_results_tree.insert("", tk.END, values=("Water Velocity", f"{results['water_velocity']:.2f}", "m/s"))
-        self.rdh_results_tree.insert("", tk.END, values=("Air Velocity", f"{results['air_velocity']:.2f}", "m/s"))
-        self.rdh_results_tree.insert("", tk.END, values=("Fan Power", f"{results['fan_power']:.3f}", "kW"))
+        self._set_tree_rows(self.rdh_results_tree, [
+            ("Water Heat Capacity", f"{results['water_heat_capacity']:.2f}", "kW"),
+            ("Air Heat Capacity", f"{results['air_heat_capacity']:.2f}", "kW"),
+            ("Effectiveness", f"{results['effectiveness']:.2f}", "%"),
+            ("Heat Transfer Coefficient", f"{results['heat_transfer_coefficient']:.2f}", "W/m²·K"),
+            ("Passive Cooling Capacity", f"{results['passive_cooling_capacity']:.2f}", "kW"),
+            ("Passive Percentage", f"{results['passive_percentage']:.2f}", "%"),
+            ("Thermal Coverage", f"{results['thermal_coverage']:.2f}", "%"),
+            ("Water Velocity", f"{results['water_velocity']:.2f}", "m/s"),
+            ("Air Velocity", f"{results['air_velocity']:.2f}", "m/s"),
+            ("Fan Power", f"{results['fan_power']:.3f}", "kW"),
+        ])
     
     def update_system_results(self, results):
         """Update the system results tree."""
         system_perf = results["system_performance"]
         
-        # Clear existing data
-        for item in self.system_results_tree.get_children():
-            self.system_results_tree.delete(item)
-        
-        # Add new data
-        self.system_results_tree.insert("", tk.END, values=("Heat Load", f"{results['input_parameters'].heat_load:.2f}", "kW"))
-        self.system_results_tree.insert("", tk.END, values=("Thermosiphon Capacity", f"{system_perf['thermosiphon_capacity']:.2f}", "kW"))
-        self.system_results_tree.insert("", tk.END, values=("Heat Pipe Capacity", f"{system_perf['heat_pipe_capacity']:.2f}", "kW"))
-        self.system_results_tree.insert("", tk.END, values=("PCM Buffer Capacity", f"{system_perf['pcm_buffer_capacity']:.2f}", "kWh"))
-        self.system_results_tree.insert("", tk.END, values=("AHU Dissipation", f"{system_perf['ahu_dissipation']:.2f}", "kW"))
-        self.system_results_tree.insert("", tk.END, values=("Thermal Load Coverage", f"{system_perf['thermal_coverage']:.2f}", "%"))
-        self.system_results_tree.insert("", tk.END, values=("Buffer Time", f"{system_perf['buffer_time']:.2f}", "min"))
-        self.system_results_tree.insert("", tk.END, values=("Conventional PUE", "1.67", ""))
-        self.system_results_tree.insert("", tk.END, values=("Passive System PUE", "1.06", ""))
-        self.system_results_tree.insert("", tk.END, values=("Energy Savings", f"{system_perf['energy_savings']:.2f}", "MWh/year"))
-        self.system_results_tree.insert("", tk.END, values=("Cost Savings", f"{system_perf['cost_savings']:.2f}", "$/year"))
-        self.system_results_tree.insert("", tk.END, values=("CO₂ Reduction", f"{system_perf['co2_reduction']:.2f}", "tonnes/year"))
-        self.system_results_tree.insert("", tk.END, values=("ROI Period", f"{system_perf['roi_period']:.2f}", "years"))
+        self._set_tree_rows(self.system_results_tree, [
+            ("Heat Load", f"{results['input_parameters'].heat_load:.2f}", "kW"),
+            ("Thermosiphon Capacity", f"{system_perf['thermosiphon_capacity']:.2f}", "kW"),
+            ("Heat Pipe Capacity", f"{system_perf['heat_pipe_capacity']:.2f}", "kW"),
+            ("PCM Buffer Capacity", f"{system_perf['pcm_buffer_capacity']:.2f}", "kWh"),
+            ("AHU Dissipation", f"{system_perf['ahu_dissipation']:.2f}", "kW"),
+            ("Thermal Load Coverage", f"{system_perf['thermal_coverage']:.2f}", "%"),
+            ("Buffer Time", f"{system_perf['buffer_time']:.2f}", "min"),
+            ("Conventional PUE", "1.67", ""),
+            ("Passive System PUE", "1.06", ""),
+            ("Energy Savings", f"{system_perf['energy_savings']:.2f}", "MWh/year"),
+            ("Cost Savings", f"{system_perf['cost_savings']:.2f}", "$/year"),
+            ("CO₂ Reduction", f"{system_perf['co2_reduction']:.2f}", "tonnes/year"),
+            ("ROI Period", f"{system_perf['roi_period']:.2f}", "years"),
+        ])
     
     def display_performance_charts(self):
         """Display system performance charts."""
@@ -1341,21 +1454,29 @@ class ThermalCalculatorApp:
         canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
     
+    @staticmethod
+    def _track_writes(var_map):
+        """Return a set collecting the names in var_map whose variables get written.
+        
+        All names start out in the set, so the first update reads every field.
+        """
+        dirty = set(var_map)
+        for name, var in var_map.items():
+            var.trace_add("write", lambda *_, name=name: dirty.add(name))
+        return dirty
+    
     def update_parameters(self):
         """Update the parameters object from the input fields."""
         try:
-            self.params.heat_load = self.heat_load_var.get()
-            self.params.ambient_temp = self.ambient_temp_var.get()
-            self.params.height = self.height_var.get()
-            self.params.cold_pipe_diameter = self.cold_pipe_diameter_var.get()
-            self.params.hot_pipe_diameter = self.hot_pipe_diameter_var.get()
-            self.params.cold_temp = self.cold_temp_var.get()
-            self.params.hot_temp = self.hot_temp_var.get()
-            self.params.heat_pipe_count = self.heat_pipe_count_var.get()
-            self.params.heat_pipe_diameter = self.heat_pipe_diameter_var.get()
-            self.params.pcm_volume = self.pcm_volume_var.get()
-            self.params.ahu_surface_area = self.ahu_surface_area_var.get()
-            self.params.dimple_density = self.dimple_density_var.get()
+            # A replaced parameters object needs every field read back
+            if self.params is not self._synced_params:
+                self._dirty_params.update(self._param_vars)
+                self._synced_params = self.params
+            
+            # Only fields written since the last update cross into Tcl
+            for name in list(self._dirty_params):
+                setattr(self.params, name, self._param_vars[name].get())
+                self._dirty_params.discard(name)
             
             # Update calculator
             self.calculator = PassiveCoolingCalculator(self.params)
@@ -1368,17 +1489,15 @@ class ThermalCalculatorApp:
     def update_rdh_parameters(self):
         """Update the RDHx parameters dictionary from the input fields."""
         try:
-            self.rdh_params["server_heat_load"] = self.rdh_heat_load_var.get()
-            self.rdh_params["inlet_water_temp"] = self.rdh_inlet_water_var.get()
-            self.rdh_params["outlet_water_temp"] = self.rdh_outlet_water_var.get()
-            self.rdh_params["inlet_air_temp"] = self.rdh_inlet_air_var.get()
-            self.rdh_params["outlet_air_temp"] = self.rdh_outlet_air_var.get()
-            self.rdh_params["water_flow_rate"] = self.rdh_water_flow_var.get()
-            self.rdh_params["air_flow_rate"] = self.rdh_air_flow_var.get()
-            self.rdh_params["fan_count"] = self.rdh_fan_count_var.get()
-            self.rdh_params["coil_rows"] = self.rdh_coil_rows_var.get()
-            self.rdh_params["door_width"] = self.rdh_door_width_var.get()
-            self.rdh_params["door_height"] = self.rdh_door_height_var.get()
+            # A replaced parameters dictionary needs every field read back
+            if self.rdh_params is not self._synced_rdh_params:
+                self._dirty_rdh.update(self._rdh_vars)
+                self._synced_rdh_params = self.rdh_params
+            
+            # Only fields written since the last update cross into Tcl
+            for name in list(self._dirty_rdh):
+                self.rdh_params[name] = self._rdh_vars[name].get()
+                self._dirty_rdh.discard(name)
             
             # Update calculator
             self.rdh_calculator = RearDoorCalculator(self.rdh_params)
@@ -1795,6 +1914,9 @@ class ThermalCalculatorApp:
             ("Heat Load", "heat_load", 50, 150, 10)
         ]
         
+        # Each parameter is swept in one vectorized pass from the current values
+        calculator = PassiveCoolingCalculator(self.params)
+        
         # Create notebook for parameter tabs
         notebook = ttk.Notebook(sensitivity_window)
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -1811,25 +1933,13 @@ class ThermalCalculatorApp:
             
             # Create x values
             x_values = np.arange(min_val, max_val + step, step)
-            y_values = []
             
-            # Calculate for each x value
-            for x in x_values:
-                # Create a copy of parameters
-                params_copy = InputParameters(**asdict(self.params))
-                
-                # Update the parameter
-                setattr(params_copy, param_id, x)
-                
-                # Calculate results
-                calculator = PassiveCoolingCalculator(params_copy)
-                results = calculator.calculate_all()
-                
-                # Get key metric
-                if param_id == "heat_load":
-                    y_values.append(results["system_performance"]["roi_period"])
-                else:
-                    y_values.append(results["system_performance"]["thermal_coverage"])
+            # Calculate the key metric over all x values
+            results = calculator.sweep(param_id, x_values)
+            if param_id == "heat_load":
+                y_values = results["roi_period"]
+            else:
+                y_values = results["thermal_coverage"]
             
             # Plot results
             ax.plot(x_values, y_values, 'bo-')
@@ -33,6 +33,12 @@ VALID_OPTIONS = {
     "units": ["metric", "imperial"]
 }
 
+# Lookup tables derived once from the definitions above
+_REQUIRED_RANGES = tuple(
+    (name, PARAMETER_RANGES[name]) for name in ("cooling_kw", "room_temp", "desired_temp", "water_temp")
+)
+_OPTION_SETS = {name: frozenset(options) for name, options in VALID_OPTIONS.items()}
+
 def validate_input_parameters(cooling_kw: float, room_temp: float, desired_temp: float, 
                               water_temp: float, **kwargs) -> Dict[str, Any]:
     """
@@ -59,26 +65,19 @@ def validate_input_parameters(cooling_kw: float, room_temp: float, desired_temp:
     }
     
     # Validate required parameters
-    required_params = {
-        "cooling_kw": cooling_kw,
-        "room_temp": room_temp,
-        "desired_temp": desired_temp,
-        "water_temp": water_temp
-    }
+    required_values = (cooling_kw, room_temp, desired_temp, water_temp)
     
-    for param_name, param_value in required_params.items():
+    for (param_name, (min_val, max_val)), param_value in zip(_REQUIRED_RANGES, required_values):
         if param_value is None:
             result["valid"] = False
             result["message"] = f"Required parameter {param_name} is missing"
             return result
             
         # Check if within reasonable range
-        if param_name in PARAMETER_RANGES:
-            min_val, max_val = PARAMETER_RANGES[param_name]
-            if not min_val <= param_value <= max_val:
-                result["valid"] = False
-                result["message"] = f"Parameter {param_name} ({param_value}) is outside valid range ({min_val} to {max_val})"
-                return result
+        if not min_val <= param_value <= max_val:
+            result["valid"] = False
+            result["message"] = f"Parameter {param_name} ({param_value}) is outside valid range ({min_val} to {max_val})"
+            return result
     
     # Validate room temperature > desired temperature for cooling
     if room_temp <= desired_temp:
@@ -99,8 +98,9 @@ def validate_input_parameters(cooling_kw: float, room_temp: float, desired_temp:
             continue
             
         # Check numerical parameters against ranges
-        if param_name in PARAMETER_RANGES:
-            min_val, max_val = PARAMETER_RANGES[param_name]
+        param_range = PARAMETER_RANGES.get(param_name)
+        if param_range is not None:
+            min_val, max_val = param_range
             try:
                 param_value = float(param_value)  # Ensure numeric value
                 if not min_val <= param_value <= max_val:
@@ -111,8 +111,9 @@ def validate_input_parameters(cooling_kw: float, room_temp: float, desired_temp:
                 return result
         
         # Check categorical parameters against valid options
-        if param_name in VALID_OPTIONS:
-            if param_value not in VALID_OPTIONS[param_name]:
+        options = _OPTION_SETS.get(param_name)
+        if options is not None:
+            if not isinstance(param_value, str) or param_value not in options:
                 result["valid"] = False
                 result["message"] = f"Parameter {param_name} ({param_value}) must be one of: {', '.join(VALID_OPTIONS[param_name])}"
                 return result
@@ -135,7 +136,8 @@ def validate_input_parameters(cooling_kw: float, room_temp: float, desired_temp:
     if not result["valid"]:
         logger.warning(f"Input validation failed: {result['message']}")
     elif result["warnings"]:
-        logger.info(f"Input validation passed with warnings: {', '.join(result['warnings'])}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Input validation passed with warnings: {', '.join(result['warnings'])}")
     else:
         logger.debug("Input validation passed")
     